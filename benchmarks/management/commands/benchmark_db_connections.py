@@ -0,0 +1,94 @@
+import importlib.util
+import statistics
+import sys
+import time
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from rest_framework_simplejwt.tokens import AccessToken
+
+from benchmarks.scenarios import SCENARIOS, ScenarioContext
+from config.load import format_summary, free_port, percentile, run_load, spawn_server
+from config.seeding import cleanup_data, seed_data
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure what persistent database connections save: the cost of opening a connection "
+        "in-process, then the same scenario under gunicorn with DB_CONN_MAX_AGE=0, with persistent "
+        "connections, and with psycopg's pool where the stack supports it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scenario', default='dashboard', choices=sorted(SCENARIOS))
+        parser.add_argument('--workers', type=int, default=2)
+        parser.add_argument('--concurrency', type=int, default=8)
+        parser.add_argument('--requests', type=int, default=1000)
+        parser.add_argument('--iterations', type=int, default=200, help="In-process connect/query samples.")
+        parser.add_argument('--max-age', type=int, default=60, help="DB_CONN_MAX_AGE for the persistent run.")
+        parser.add_argument('--keep', action='store_true', help="Leave the seeded rows in place.")
+
+    def handle(self, *args, **options):
+        database = settings.DATABASES['default']
+        if database['NAME'] == ':memory:':
+            raise CommandError("The server needs a shared database; in-memory SQLite will not work.")
+        self.stdout.write(self.style.SUCCESS(f"{database['ENGINE'].rsplit('.', 1)[-1]} database, {options['iterations']} samples"))
+        self._measure_connect(options['iterations'])
+
+        configurations = [
+            ('new connection per request', {'DB_CONN_MAX_AGE': '0', 'DB_POOL': 'false'}),
+            (f"persistent (max age {options['max_age']}s)", {'DB_CONN_MAX_AGE': str(options['max_age']), 'DB_POOL': 'false'}),
+        ]
+        if self._pool_supported(database):
+            configurations.append(('psycopg pool', {'DB_POOL': 'true'}))
+        else:
+            self.stdout.write("Connection pool needs Django 5.1+, psycopg[pool] and PostgreSQL; skipping the pool run.")
+
+        users = seed_data(users=20, events=2000, feedback=0, contacts=0).users
+        context = ScenarioContext(
+            emails=[user.email for user in users],
+            tokens=[str(AccessToken.for_user(user)) for user in users],
+        )
+        try:
+            for name, env in configurations:
+                port = free_port()
+                command = [
+                    sys.executable, '-m', 'gunicorn', 'config.wsgi',
+                    '--workers', str(options['workers']), '--bind', f'127.0.0.1:{port}',
+                ]
+                with spawn_server(command, port, env):
+                    summary = run_load(
+                        options['scenario'], port, SCENARIOS[options['scenario']](context),
+                        options['requests'], options['concurrency'],
+                    ).summary()
+                self.stdout.write(format_summary({**summary, 'name': name}, width=28))
+        finally:
+            if not options['keep']:
+                cleanup_data()
+
+    def _measure_connect(self, iterations):
+        def sample(reconnect):
+            if reconnect:
+                connection.close()
+            started = time.perf_counter()
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+                cursor.fetchone()
+            return (time.perf_counter() - started) * 1000
+
+        for name, reconnect in (('connect + SELECT 1', True), ('SELECT 1 on open connection', False)):
+            samples = [sample(reconnect) for _ in range(iterations)]
+            self.stdout.write(
+                f"  {name:<28} mean {statistics.fmean(samples):7.3f} ms  "
+                f"p50 {percentile(samples, 0.50):7.3f} ms  p95 {percentile(samples, 0.95):7.3f} ms"
+            )
+
+    @staticmethod
+    def _pool_supported(database):
+        return (
+            database['ENGINE'] == 'django.db.backends.postgresql'
+            and django.VERSION >= (5, 1)
+            and importlib.util.find_spec('psycopg_pool') is not None
+        )
@@ -0,0 +1,126 @@
+import json
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import AccessToken
+
+from benchmarks.scenarios import SCENARIOS, ScenarioContext, drain_benchmark_notifications
+from config.load import format_summary, free_port, run_load, spawn_server
+from config.seeding import benchmark_users, cleanup_data, seed_data
+
+# Throttles would turn most of a load test into 429s.
+UNTHROTTLED = {
+    f'THROTTLE_{scope.upper()}_{bucket.upper()}': '1000000/min'
+    for scope, buckets in settings.TOKEN_BUCKET_THROTTLES.items()
+    for bucket in buckets
+}
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the scripted API scenarios (login, event list, dashboard, event creation) against a "
+        "locally spawned gunicorn and report throughput and p50/p95/p99 latency. Use --json to save "
+        "a run and --compare to diff it against an earlier one, e.g. from another commit."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS), help="Repeat to pick several; default all.")
+        parser.add_argument('--workers', type=int, default=2)
+        parser.add_argument('--concurrency', type=int, default=16)
+        parser.add_argument('--requests', type=int, default=500, help="Requests per scenario.")
+        parser.add_argument('--users', type=int, default=50)
+        parser.add_argument('--events', type=int, default=10000)
+        parser.add_argument('--reuse', action='store_true', help="Use already seeded benchmark users instead of seeding.")
+        parser.add_argument('--keep', action='store_true', help="Leave the seeded rows in place.")
+        parser.add_argument('--json', dest='json_path', help="Write the results to this file.")
+        parser.add_argument('--compare', dest='compare_path', help="Print deltas against a file written by --json.")
+
+    def handle(self, *args, **options):
+        if settings.DATABASES['default']['NAME'] == ':memory:':
+            raise CommandError("The server needs a shared database; in-memory SQLite will not work.")
+        names = options['scenario'] or list(SCENARIOS)
+        if settings.DATABASES['default']['ENGINE'].endswith('sqlite3') and 'event-create' in names:
+            self.stderr.write(self.style.WARNING(
+                "SQLite allows one writer at a time, so event-create will report 'database is locked' "
+                "errors under concurrency. Point DATABASE_URL at PostgreSQL for representative numbers."
+            ))
+
+        if options['reuse']:
+            users = list(benchmark_users().order_by('pk'))
+            if not users:
+                raise CommandError("No seeded benchmark users; run seed_benchmark_data or drop --reuse.")
+        else:
+            self.stdout.write(f"Seeding {options['users']} users and {options['events']} events...")
+            users = seed_data(users=options['users'], events=options['events']).users
+        context = ScenarioContext(
+            emails=[user.email for user in users],
+            tokens=[str(AccessToken.for_user(user)) for user in users],
+        )
+
+        port = free_port()
+        command = [
+            sys.executable, '-m', 'gunicorn', 'config.wsgi',
+            '--workers', str(options['workers']), '--bind', f'127.0.0.1:{port}',
+        ]
+        env = {**UNTHROTTLED, 'EMAIL_BACKEND': 'django.core.mail.backends.locmem.EmailBackend'}
+        report = {
+            'commit': current_commit(),
+            'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'options': {key: options[key] for key in ('workers', 'concurrency', 'requests', 'users', 'events')},
+            'results': [],
+        }
+        try:
+            with spawn_server(command, port, env):
+                self.stdout.write(self.style.SUCCESS(
+                    f"gunicorn @ {report['commit']}, {options['workers']} workers, "
+                    f"{options['concurrency']} concurrent clients, {options['requests']} requests per scenario"
+                ))
+                for name in names:
+                    result = run_load(name, port, SCENARIOS[name](context), options['requests'], options['concurrency'])
+                    report['results'].append(result.summary())
+                    self.stdout.write(format_summary(result.summary()))
+            if 'event-create' in names:
+                report['notifications'] = drain_benchmark_notifications()
+                self.stdout.write(
+                    "  notifications: {notifications} delivered, {emails} emails in {seconds}s "
+                    "({emails_per_second} emails/s, locmem backend)".format(**report['notifications'])
+                )
+        finally:
+            if not options['keep'] and not options['reuse']:
+                cleanup_data()
+
+        if options['json_path']:
+            with open(options['json_path'], 'w') as handle:
+                json.dump(report, handle, indent=2)
+        if options['compare_path']:
+            self._compare(report, options['compare_path'])
+
+    def _compare(self, report, path):
+        try:
+            with open(path) as handle:
+                baseline = json.load(handle)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Cannot read {path}: {exc}")
+        previous = {summary['name']: summary for summary in baseline.get('results', [])}
+        self.stdout.write(self.style.SUCCESS(f"Compared with {baseline.get('commit', 'unknown')}"))
+        for summary in report['results']:
+            before = previous.get(summary['name'])
+            if not before or not before['throughput'] or not before['p95_ms'] or summary['p95_ms'] is None:
+                continue
+            self.stdout.write(
+                f"  {summary['name']:<14} throughput {summary['throughput'] / before['throughput'] - 1:+7.1%}  "
+                f"p95 {summary['p95_ms'] / before['p95_ms'] - 1:+7.1%}"
+            )
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from config.seeding import BENCHMARK_PASSWORD, cleanup_data, seed_data
+
+
+class Command(BaseCommand):
+    help = "Bulk-create synthetic users, events, feedback and contacts for load testing, or remove them with --cleanup."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100)
+        parser.add_argument('--events', type=int, default=10000)
+        parser.add_argument('--feedback', type=int, default=500)
+        parser.add_argument('--contacts', type=int, default=500)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=0, help="Random seed for reproducible data.")
+        parser.add_argument('--cleanup', action='store_true', help="Delete previously seeded rows instead of creating more.")
+
+    def handle(self, *args, **options):
+        if options['cleanup']:
+            removed = cleanup_data()
+            self.stdout.write(self.style.SUCCESS(
+                "Removed " + ', '.join(f"{count} {name}" for name, count in removed.items()) + "."
+            ))
+            return
+
+        seeded = seed_data(
+            users=options['users'],
+            events=options['events'],
+            feedback=options['feedback'],
+            contacts=options['contacts'],
+            batch_size=options['batch_size'],
+            seed=options['seed'],
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {len(seeded.users)} users, {len(seeded.events)} events, {len(seeded.feedback)} feedback "
+            f"and {seeded.contacts} contacts. Users log in with password '{BENCHMARK_PASSWORD}'."
+        ))
@@ -0,0 +1,92 @@
+"""
+Scripted API scenarios for `run_benchmarks`. Each scenario turns a request
+index into (method, path, headers, json_body), spreading requests across the
+seeded users.
+"""
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.core import mail
+from django.db import transaction
+from django.test import override_settings
+from django.utils import timezone
+
+from config.seeding import BENCHMARK_PASSWORD, benchmark_users
+from events.models import NotificationOutbox
+from events.notifications import deliver_notification
+
+
+@dataclass
+class ScenarioContext:
+    emails: list[str]
+    tokens: list[str]
+
+    def auth(self, index: int) -> dict:
+        return {'Authorization': f'Bearer {self.tokens[index % len(self.tokens)]}'}
+
+
+def login(context: ScenarioContext):
+    return lambda index: (
+        'POST',
+        '/api/users/login/',
+        {},
+        {'email': context.emails[index % len(context.emails)], 'password': BENCHMARK_PASSWORD},
+    )
+
+
+def event_list(context: ScenarioContext):
+    return lambda index: ('GET', '/api/events/?page_size=50', context.auth(index), None)
+
+
+def dashboard(context: ScenarioContext):
+    return lambda index: ('GET', '/api/dashboard/stats/', context.auth(index), None)
+
+
+def event_create(context: ScenarioContext):
+    starts = (timezone.now() + timedelta(days=30)).isoformat()
+    return lambda index: (
+        'POST',
+        '/api/events/',
+        context.auth(index),
+        {'title': f'Benchmark launch {index}', 'description': 'Created by run_benchmarks.', 'event_date': starts},
+    )
+
+
+SCENARIOS = {
+    'login': login,
+    'event-list': event_list,
+    'dashboard': dashboard,
+    'event-create': event_create,
+}
+
+
+def drain_benchmark_notifications() -> dict:
+    """
+    Deliver the outbox rows queued by benchmark events through the locmem email
+    backend and time it. Only benchmark rows are touched, so running against a
+    shared database never marks real notifications as sent.
+    """
+    pending = NotificationOutbox.objects.filter(
+        status=NotificationOutbox.STATUS_PENDING,
+        event__created_by__in=benchmark_users(),
+    ).order_by('pk')
+    notifications = emails = 0
+    started = time.perf_counter()
+    with override_settings(
+        EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+        DEFAULT_FROM_EMAIL='benchmarks@plansync.invalid',
+    ):
+        for notification in pending.iterator():
+            with transaction.atomic():
+                deliver_notification(notification)
+            notifications += 1
+            emails += notification.sent_count
+            mail.outbox = []
+    elapsed = time.perf_counter() - started
+    return {
+        'notifications': notifications,
+        'emails': emails,
+        'seconds': round(elapsed, 2),
+        'emails_per_second': round(emails / elapsed, 1) if elapsed else 0.0,
+    }
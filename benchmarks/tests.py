@@ -0,0 +1,99 @@
+from datetime import datetime, timezone
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from config.load import LoadResult, format_summary, percentile
+from config.seeding import BENCHMARK_EMAIL_DOMAIN, BENCHMARK_PASSWORD, cleanup_data, seed_data
+from contact.models import Contact
+from events.models import Event, NotificationOutbox
+from events.notifications import queue_event_created_notification
+from feedback.models import Feedback
+from feedback.stats import get_rating_stats
+
+from .scenarios import SCENARIOS, ScenarioContext, drain_benchmark_notifications
+
+User = get_user_model()
+EVENT_DATE = datetime(2030, 1, 1, 10, tzinfo=timezone.utc)
+
+
+class SeedingTests(APITestCase):
+    def test_seed_creates_requested_rows_and_users_can_log_in(self):
+        seeded = seed_data(users=3, events=30, feedback=10, contacts=4, batch_size=7)
+
+        self.assertEqual(len(seeded.users), 3)
+        self.assertEqual(Event.objects.filter(created_by__in=seeded.users).count(), 30)
+        self.assertEqual(Contact.objects.count(), 4)
+        self.assertEqual(get_rating_stats()['total'], 10)
+        response = self.client.post(
+            reverse('user-login'), {'email': seeded.users[0].email, 'password': BENCHMARK_PASSWORD}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_cleanup_removes_only_seeded_rows(self):
+        owner = User.objects.create_user(username='owner@example.com', email='owner@example.com', password='StrongPass123!')
+        Event.objects.create(title='Real event', event_date=EVENT_DATE, created_by=owner)
+        Feedback.objects.create(name='Real customer', quote='Great', rating=5)
+        seed_data(users=2, events=10, feedback=5, contacts=2)
+
+        call_command('seed_benchmark_data', '--cleanup', stdout=StringIO())
+
+        self.assertFalse(User.objects.filter(email__endswith=f'@{BENCHMARK_EMAIL_DOMAIN}').exists())
+        self.assertTrue(User.objects.filter(pk=owner.pk).exists())
+        self.assertEqual(Event.objects.count(), 1)
+        self.assertEqual(Contact.objects.count(), 0)
+        self.assertEqual(get_rating_stats()['total'], 1)
+
+
+class ScenarioTests(APITestCase):
+    def test_event_create_scenario_posts_a_valid_event(self):
+        user = seed_data(users=1, events=0, feedback=0, contacts=0).users[0]
+        self.client.force_authenticate(user)
+        context = ScenarioContext(emails=[user.email], tokens=['unused'])
+
+        method, path, _, body = SCENARIOS['event-create'](context)(7)
+        self.assertEqual(method, 'POST')
+        response = self.client.post(path, body, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_drain_delivers_only_benchmark_notifications(self):
+        owner = User.objects.create_user(username='owner@example.com', email='owner@example.com', password='StrongPass123!')
+        real = queue_event_created_notification(
+            Event.objects.create(title='Real event', event_date=EVENT_DATE, created_by=owner)
+        )
+        seeded = seed_data(users=2, events=0, feedback=0, contacts=0)
+        benchmark_event = Event.objects.create(title='Bench event', event_date=EVENT_DATE, created_by=seeded.users[0])
+        queue_event_created_notification(benchmark_event)
+
+        report = drain_benchmark_notifications()
+
+        self.assertEqual(report['notifications'], 1)
+        self.assertEqual(report['emails'], User.objects.exclude(pk=seeded.users[0].pk).count())
+        real.refresh_from_db()
+        self.assertEqual(real.status, NotificationOutbox.STATUS_PENDING)
+        cleanup_data()
+        self.assertFalse(NotificationOutbox.objects.exclude(pk=real.pk).exists())
+
+
+class LoadResultTests(APITestCase):
+    def test_summary_reports_throughput_percentiles_and_errors(self):
+        result = LoadResult(name='event-list', elapsed=2.0, latencies_ms=[float(ms) for ms in range(1, 101)], statuses=[200] * 98 + [500, 429])
+
+        summary = result.summary()
+
+        self.assertEqual(summary['throughput'], 50.0)
+        self.assertEqual(summary['errors'], 2)
+        self.assertEqual((summary['p50_ms'], summary['p95_ms'], summary['p99_ms']), (51.0, 95.0, 99.0))
+        self.assertEqual(percentile([3.0], 0.99), 3.0)
+
+    def test_summary_of_an_empty_run_has_no_latencies(self):
+        summary = LoadResult(name='event-list', elapsed=1.0).summary()
+
+        self.assertEqual((summary['requests'], summary['throughput']), (0, 0.0))
+        self.assertIsNone(summary['p99_ms'])
+        self.assertIn('p99       - ms', format_summary(summary))
@@ -0,0 +1,87 @@
+from asgiref.sync import sync_to_async
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.views import exception_handler
+
+
+class AsyncAPIView(View):
+    """
+    Async counterpart of DRF's `APIView` for ASGI deployments (see `ASYNC_VIEWS`).
+
+    DRF views are synchronous, so under an ASGI server each request is handed
+    to a worker thread for its whole lifetime. Here only authentication (which
+    may hit the cache or database) runs in a thread; handlers are coroutines
+    that await the async ORM. Requests and errors go through the same DRF
+    `Request`, authentication, permission and exception handling as the sync
+    views, and responses are always rendered as JSON.
+    """
+
+    authentication_classes = api_settings.DEFAULT_AUTHENTICATION_CLASSES
+    permission_classes = api_settings.DEFAULT_PERMISSION_CLASSES
+    parser_classes = [JSONParser]
+    renderer_class = api_settings.DEFAULT_RENDERER_CLASSES[0]
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Same as APIView: only session authentication needs CSRF, and it
+        # enforces that itself.
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        self.request = Request(
+            request,
+            parsers=[parser() for parser in self.parser_classes],
+            authenticators=[authenticator() for authenticator in self.authentication_classes],
+        )
+        try:
+            await sync_to_async(self.initial)(self.request)
+            handler = getattr(self, request.method.lower(), None)
+            if request.method.lower() not in self.http_method_names or handler is None:
+                raise exceptions.MethodNotAllowed(request.method)
+            response = await handler(self.request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+        return self.finalize_response(response)
+
+    def initial(self, request):
+        request.user
+        for permission in [permission() for permission in self.permission_classes]:
+            if not permission.has_permission(request, self):
+                if request.authenticators and not request.successful_authenticator:
+                    raise exceptions.NotAuthenticated()
+                raise exceptions.PermissionDenied(getattr(permission, 'message', None))
+
+    def check_object_permissions(self, request, obj):
+        for permission in [permission() for permission in self.permission_classes]:
+            if not permission.has_object_permission(request, self, obj):
+                raise exceptions.PermissionDenied(getattr(permission, 'message', None))
+
+    def handle_exception(self, exc):
+        if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            authenticators = self.request.authenticators
+            auth_header = authenticators[0].authenticate_header(self.request) if authenticators else None
+            if auth_header:
+                exc.auth_header = auth_header
+            else:
+                exc.status_code = 403
+        response = exception_handler(exc, {'view': self, 'args': self.args, 'kwargs': self.kwargs, 'request': self.request})
+        if response is None:
+            raise exc
+        response.exception = True
+        return response
+
+    def finalize_response(self, response):
+        if isinstance(response, Response):
+            # Render here rather than letting Django defer it to a thread.
+            response.accepted_renderer = self.renderer_class()
+            response.accepted_media_type = self.renderer_class.media_type
+            response.renderer_context = {'view': self, 'args': self.args, 'kwargs': self.kwargs, 'request': self.request}
+            response.render()
+        return response
@@ -0,0 +1,94 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified support for DRF list and retrieve actions.
+
+    Validators come from `last_modified_field`: the instance value for detail
+    reads, and for paginated collections the keys and timestamps of the rows on
+    the page plus whether it has neighbours, so the page query is the only one
+    run. Unpaginated collections (feeds) fall back to `max()` plus the row count
+    of the filtered queryset, which lets an unchanged feed answer 304 without
+    reading it. Collections get an ETag only: a second-resolution Last-Modified
+    cannot see deletions or a second edit within the same second. A matching
+    `If-None-Match` (or `If-Modified-Since` on detail reads) short-circuits to
+    304 before anything is serialized.
+    """
+
+    last_modified_field = 'updated_at'
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self._conditional_response(
+                request,
+                page_version(page, self.last_modified_field, self.paginator),
+                None,
+                lambda: self.get_paginated_response(self.get_serializer(page, many=True).data),
+            )
+
+        summary = queryset.order_by().aggregate(
+            last_modified=Max(self.last_modified_field),
+            count=Count('pk'),
+        )
+        return self._conditional_response(
+            request,
+            collection_version(summary),
+            None,
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        last_modified = getattr(instance, self.last_modified_field)
+        return self._conditional_response(
+            request,
+            f"{instance.pk}:{last_modified.isoformat()}",
+            last_modified,
+            lambda: Response(self.get_serializer(instance).data),
+        )
+
+    def _conditional_response(self, request, version, last_modified, render):
+        etag, timestamp = conditional_validators(request, version, last_modified)
+        not_modified = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if not_modified is not None:
+            return apply_validators(not_modified, etag, timestamp)
+        return apply_validators(render(), etag, timestamp)
+
+
+def collection_version(summary):
+    """Version string for a collection from its `last_modified` and `count` aggregates."""
+    return f"{summary['count']}:{summary['last_modified'] and summary['last_modified'].isoformat()}"
+
+
+def page_version(rows, last_modified_field, paginator):
+    """Version string for one page from its rows' keys and timestamps and its links."""
+    stamps = ','.join(f"{row.pk}:{getattr(row, last_modified_field).isoformat()}" for row in rows)
+    return f"{paginator.get_next_link()}|{paginator.get_previous_link()}|{stamps}"
+
+
+def conditional_validators(request, version, last_modified):
+    """Return the (ETag, Last-Modified timestamp) pair for a representation."""
+    # The representation also depends on the query string (page cursor,
+    # sparse fields, filters) and the negotiated media type.
+    digest = hashlib.sha1(
+        f"{version}|{request.get_full_path()}|{request.META.get('HTTP_ACCEPT', '')}".encode()
+    ).hexdigest()
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    return quote_etag(digest), timestamp
+
+
+def apply_validators(response, etag, timestamp):
+    response['ETag'] = etag
+    # Both feed into the ETag: what a user may see and the negotiated format.
+    patch_vary_headers(response, ('Accept', 'Authorization'))
+    if timestamp is not None:
+        response['Last-Modified'] = http_date(timestamp)
+    return response
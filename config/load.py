@@ -0,0 +1,163 @@
+"""
+Helpers shared by the benchmark commands in every app: driving a locally
+spawned server (process start-up, concurrent HTTP load from a thread pool),
+timing in-process calls, and latency percentiles.
+"""
+import http.client
+import json
+import os
+import socket
+import statistics
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.core.management.base import CommandError
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def percentile(samples, fraction) -> Optional[float]:
+    """Nearest-rank percentile of `samples`, or None when there are none."""
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def time_call(func, repeat: int = 5) -> dict:
+    """Run `func` `repeat` times and return median/min/max wall time in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        'median_ms': statistics.median(samples),
+        'min_ms': min(samples),
+        'max_ms': max(samples),
+    }
+
+
+def wait_until_ready(port: int, path: str = '/api/events/?page_size=1', timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            connection.request('GET', path)
+            connection.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise CommandError(f"Server on port {port} did not start within {timeout}s.")
+
+
+@contextmanager
+def spawn_server(command: list[str], port: int, env: Optional[dict] = None):
+    """
+    Run `command` until the block exits. Outside production SECRET_KEY is
+    random per process, so ours is shared to keep tokens signed here valid.
+    """
+    process = subprocess.Popen(
+        command,
+        env={**os.environ, 'DEBUG': 'false', 'SECRET_KEY': settings.SECRET_KEY, **(env or {})},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_ready(port)
+        yield process
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+@dataclass
+class LoadResult:
+    name: str
+    elapsed: float
+    latencies_ms: list[float] = field(default_factory=list)
+    statuses: list[int] = field(default_factory=list)
+
+    @property
+    def errors(self) -> int:
+        return sum(1 for status in self.statuses if status >= 400)
+
+    def summary(self) -> dict:
+        """Throughput and latency figures; latencies are None for a run with no samples."""
+        samples = self.latencies_ms
+
+        def rounded(value):
+            return None if value is None else round(value, 1)
+
+        return {
+            'name': self.name,
+            'requests': len(samples),
+            'errors': self.errors,
+            'throughput': round(len(samples) / self.elapsed, 1) if self.elapsed else 0.0,
+            'p50_ms': rounded(percentile(samples, 0.50)),
+            'p95_ms': rounded(percentile(samples, 0.95)),
+            'p99_ms': rounded(percentile(samples, 0.99)),
+            'mean_ms': rounded(statistics.fmean(samples) if samples else None),
+        }
+
+
+def format_summary(summary: dict, width: int = 14) -> str:
+    """One report line for a `LoadResult.summary()`."""
+
+    def ms(value):
+        return '      - ms' if value is None else f"{value:7.1f} ms"
+
+    return (
+        f"  {summary['name']:<{width}} {summary['throughput']:8.1f} req/s  "
+        f"p50 {ms(summary['p50_ms'])}  p95 {ms(summary['p95_ms'])}  "
+        f"p99 {ms(summary['p99_ms'])}  errors {summary['errors']}"
+    )
+
+
+def run_load(
+    name: str,
+    port: int,
+    build_request: Callable[[int], tuple],
+    total: int,
+    concurrency: int,
+) -> LoadResult:
+    """
+    Issue `total` requests from `concurrency` threads. `build_request(index)`
+    returns (method, path, headers, json_body or None).
+    """
+
+    def fetch(index):
+        method, path, headers, body = build_request(index)
+        payload = json.dumps(body).encode() if body is not None else None
+        headers = {**headers, 'Content-Type': 'application/json'} if payload is not None else headers
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+        started = time.perf_counter()
+        try:
+            connection.request(method, path, body=payload, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            status = response.status
+        except OSError:
+            status = 599
+        finally:
+            connection.close()
+        return status, (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(fetch, range(total)))
+    return LoadResult(
+        name=name,
+        elapsed=time.perf_counter() - started,
+        latencies_ms=[latency for _, latency in results],
+        statuses=[status for status, _ in results],
+    )
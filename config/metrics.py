@@ -0,0 +1,220 @@
+"""
+Request-level performance metrics.
+
+`MetricsMiddleware` times every request and, through a database execute
+wrapper, counts its SQL queries and their time; `TimedJSONRenderer` adds the
+time DRF spends rendering the response body. Results are aggregated per
+(method, route, status) into histograms served by `metrics_view` in the
+Prometheus text format, and requests slower than `SLOW_REQUEST_THRESHOLD_MS`
+are logged with their queries.
+
+The registry lives in process memory, so each worker process reports its own
+numbers; scrape every worker (or run one worker per scrape target) to see
+them all.
+"""
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from rest_framework.renderers import JSONRenderer
+
+logger = logging.getLogger(__name__)
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+# Any other method a client sends is labelled OTHER, so label values stay bounded.
+HTTP_METHODS = frozenset({'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS', 'TRACE', 'CONNECT'})
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+    render_seconds: float = 0.0
+    sql: list[tuple[str, float]] = field(default_factory=list)
+
+
+_current_request: ContextVar[Optional[RequestStats]] = ContextVar('metrics_current_request', default=None)
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, buckets: tuple):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self.series = defaultdict(lambda: [[0] * len(buckets), 0.0, 0])
+
+    def observe(self, labels: tuple, value: float) -> None:
+        counts, _, _ = series = self.series[labels]
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+        series[1] += value
+        series[2] += 1
+
+    def exposition(self, label_names: tuple) -> list[str]:
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        for labels, (counts, total, count) in sorted(self.series.items()):
+            base = ','.join(f'{name}="{_escape_label(value)}"' for name, value in zip(label_names, labels))
+            for bound, bucket_count in zip(self.buckets, counts):
+                lines.append(f'{self.name}_bucket{{{base},le="{bound}"}} {bucket_count}')
+            lines.append(f'{self.name}_bucket{{{base},le="+Inf"}} {count}')
+            lines.append(f'{self.name}_sum{{{base}}} {total}')
+            lines.append(f'{self.name}_count{{{base}}} {count}')
+        return lines
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class MetricsRegistry:
+    label_names = ('method', 'route', 'status')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms = (
+                Histogram('http_request_duration_seconds', 'Time spent handling the request.', DURATION_BUCKETS),
+                Histogram('http_request_db_queries', 'SQL queries executed per request.', QUERY_COUNT_BUCKETS),
+                Histogram('http_request_db_duration_seconds', 'Time spent in SQL queries per request.', DURATION_BUCKETS),
+                Histogram('http_request_render_duration_seconds', 'Time spent rendering the response body.', DURATION_BUCKETS),
+            )
+
+    def observe(self, labels: tuple, duration: float, stats: RequestStats) -> None:
+        values = (duration, stats.queries, stats.db_seconds, stats.render_seconds)
+        with self._lock:
+            for histogram, value in zip(self.histograms, values):
+                histogram.observe(labels, value)
+
+    def exposition(self) -> str:
+        with self._lock:
+            lines = [line for histogram in self.histograms for line in histogram.exposition(self.label_names)]
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+
+def _record_query(execute, sql, params, many, context):
+    stats = _current_request.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - started
+        stats.queries += 1
+        stats.db_seconds += elapsed
+        if settings.SLOW_REQUEST_THRESHOLD_MS and len(stats.sql) < settings.SLOW_REQUEST_MAX_QUERIES:
+            stats.sql.append((sql, elapsed))
+
+
+def _install_query_recorder(connection, **kwargs) -> None:
+    # Installed once per connection object and left in place: it is a no-op
+    # outside a request, and async views query from executor threads whose
+    # connections a per-request `execute_wrapper()` block would never see.
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+class MetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        connection_created.connect(_install_query_recorder, dispatch_uid='config.metrics.query_recorder')
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        for connection in connections.all(initialized_only=True):
+            _install_query_recorder(connection)
+        stats, token, started = self._start()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_request.reset(token)
+        self._finish(request, response, stats, started)
+        return response
+
+    async def __acall__(self, request):
+        stats, token, started = self._start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_request.reset(token)
+        self._finish(request, response, stats, started)
+        return response
+
+    @staticmethod
+    def _start():
+        stats = RequestStats()
+        return stats, _current_request.set(stats), time.perf_counter()
+
+    @staticmethod
+    def _finish(request, response, stats: RequestStats, started: float) -> None:
+        duration = time.perf_counter() - started
+        match = getattr(request, 'resolver_match', None)
+        route = match.route if match is not None else 'unmatched'
+        method = request.method if request.method in HTTP_METHODS else 'OTHER'
+        registry.observe((method, route, str(response.status_code)), duration, stats)
+
+        threshold = settings.SLOW_REQUEST_THRESHOLD_MS
+        if threshold and duration * 1000 >= threshold:
+            logger.warning(
+                "Slow request %s %s -> %s in %.1f ms (%s queries, %.1f ms SQL, %.1f ms render)\n%s",
+                request.method,
+                request.get_full_path(),
+                response.status_code,
+                duration * 1000,
+                stats.queries,
+                stats.db_seconds * 1000,
+                stats.render_seconds * 1000,
+                '\n'.join(f"  {elapsed * 1000:7.1f} ms  {sql}" for sql, elapsed in stats.sql),
+            )
+
+
+class TimedRendererMixin:
+    """Adds DRF response rendering time to the current request's stats."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        started = time.perf_counter()
+        try:
+            return super().render(data, accepted_media_type, renderer_context)
+        finally:
+            stats = _current_request.get()
+            if stats is not None:
+                stats.render_seconds += time.perf_counter() - started
+
+
+class TimedJSONRenderer(TimedRendererMixin, JSONRenderer):
+    # The browsable API renders its content through the view's JSON renderer,
+    # so timing this class alone covers both without double counting.
+    pass
+
+
+def metrics_view(request):
+    token = settings.METRICS_TOKEN
+    if token and not constant_time_compare(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return HttpResponseForbidden()
+    return HttpResponse(registry.exposition(), content_type=PROMETHEUS_CONTENT_TYPE)
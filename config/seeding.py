@@ -0,0 +1,147 @@
+"""
+Synthetic data for load tests and benchmarks, created with `bulk_create`.
+
+Shared by the benchmark commands and the query-budget tests. Seeded users and
+contacts use the `BENCHMARK_EMAIL_DOMAIN` and feedback uses
+`FEEDBACK_NAME_PREFIX`, so `cleanup_data` can remove exactly what was seeded
+(events, their outbox rows and reminder logs go with their creators).
+"""
+import random
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from itertools import islice
+from typing import Iterable
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+
+from contact.models import Contact
+from events.models import Event, NotificationOutbox
+from feedback.models import Feedback
+from feedback.stats import adjust_rating_count
+
+User = get_user_model()
+
+BENCHMARK_EMAIL_DOMAIN = 'benchmark.invalid'
+BENCHMARK_PASSWORD = 'benchmark-password-123'
+FEEDBACK_NAME_PREFIX = 'Benchmark customer'
+WORDS = (
+    'planning', 'review', 'launch', 'retro', 'standup', 'workshop', 'demo', 'sync',
+    'offsite', 'hiring', 'budget', 'roadmap', 'security', 'design', 'customer', 'training',
+)
+
+
+@dataclass
+class SeededData:
+    users: list
+    events: list
+    feedback: list
+    contacts: int
+
+
+def _bulk_create(model, objects: Iterable, batch_size: int) -> list:
+    created = []
+    objects = iter(objects)
+    while batch := list(islice(objects, batch_size)):
+        created.extend(model.objects.bulk_create(batch))
+    return created
+
+
+def seed_data(
+    users: int = 100,
+    events: int = 10000,
+    feedback: int = 500,
+    contacts: int = 500,
+    batch_size: int = 5000,
+    seed: int = 0,
+    span_days: int = 365,
+) -> SeededData:
+    """
+    Create `users` members who can log in with `BENCHMARK_PASSWORD`, `events`
+    spread `span_days` either side of now and shared round-robin between them,
+    and `feedback` and `contacts` submissions.
+    """
+    rng = random.Random(seed)
+    run_tag = f"{int(time.time())}-{rng.randrange(10**6)}"
+    # Hash once: the configured hasher is deliberately slow.
+    password = make_password(BENCHMARK_PASSWORD)
+    seeded_users = _bulk_create(
+        User,
+        (
+            User(
+                username=f'bench-{run_tag}-{index}@{BENCHMARK_EMAIL_DOMAIN}',
+                email=f'bench-{run_tag}-{index}@{BENCHMARK_EMAIL_DOMAIN}',
+                first_name='Bench',
+                last_name=str(index),
+                password=password,
+            )
+            for index in range(users)
+        ),
+        batch_size,
+    )
+    if seeded_users and seeded_users[0].pk is None:
+        seeded_users = list(User.objects.filter(email__startswith=f'bench-{run_tag}-').order_by('pk'))
+
+    now = timezone.now()
+    span_minutes = span_days * 24 * 60
+    seeded_events = []
+    if seeded_users:
+        seeded_events = _bulk_create(
+            Event,
+            (
+                Event(
+                    title=f"{rng.choice(WORDS).title()} {rng.choice(WORDS)} #{index}",
+                    # `refNNNN` tokens are rare (about `events / 5000` rows each),
+                    # giving searches a selective term alongside the common vocabulary.
+                    description=' '.join(rng.choice(WORDS) for _ in range(30)) + f' ref{rng.randrange(5000)}',
+                    event_date=now + timedelta(minutes=rng.randint(-span_minutes, span_minutes)),
+                    created_by=seeded_users[index % len(seeded_users)],
+                )
+                for index in range(events)
+            ),
+            batch_size,
+        )
+
+    seeded_feedback = _bulk_create(
+        Feedback,
+        (
+            Feedback(name=f'{FEEDBACK_NAME_PREFIX} {index}', quote=' '.join(rng.choice(WORDS) for _ in range(12)), rating=rng.randint(1, 5))
+            for index in range(feedback)
+        ),
+        batch_size,
+    )
+    # bulk_create skips the signals that keep the rating counters in step.
+    for rating in range(1, 6):
+        count = sum(1 for item in seeded_feedback if item.rating == rating)
+        if count:
+            adjust_rating_count(rating, count)
+
+    contact_count = len(_bulk_create(
+        Contact,
+        (
+            Contact(name=f'Lead {index}', email=f'lead-{run_tag}-{index}@{BENCHMARK_EMAIL_DOMAIN}', message='Tell me more about PlanSync.')
+            for index in range(contacts)
+        ),
+        batch_size,
+    ))
+    return SeededData(users=seeded_users, events=seeded_events, feedback=seeded_feedback, contacts=contact_count)
+
+
+def benchmark_users():
+    return User.objects.filter(email__endswith=f'@{BENCHMARK_EMAIL_DOMAIN}')
+
+
+def cleanup_data() -> dict:
+    """Delete everything `seed_data` (and the benchmark scenarios) created."""
+    removed = {
+        'notifications': NotificationOutbox.objects.filter(event__created_by__in=benchmark_users()).delete()[0],
+        # Per-row delete signals keep the rating counters correct.
+        'feedback': Feedback.objects.filter(name__startswith=FEEDBACK_NAME_PREFIX).delete()[0],
+        'contacts': Contact.objects.filter(email__endswith=f'@{BENCHMARK_EMAIL_DOMAIN}').delete()[0],
+    }
+    _, per_model = benchmark_users().delete()
+    removed['users'] = per_model.get(User._meta.label, 0)
+    removed['events'] = per_model.get(Event._meta.label, 0)
+    return removed
@@ -1,7 +1,10 @@
+import importlib.util
 import os
 import environ
 from datetime import timedelta
 from pathlib import Path
+import django
+from django.core.exceptions import ImproperlyConfigured
 from django.core.management.utils import get_random_secret_key
 
 env = environ.Env(DEBUG=(bool, False))
@@ -40,6 +43,7 @@ INSTALLED_APPS = [
     "dashboard",
     "feedback",
     "contact",
+    "benchmarks",
 ]
 
 MIDDLEWARE = [
@@ -54,6 +58,28 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Route events and dashboard requests to the async views (events.async_views,
+# dashboard.async_views). Only worth enabling when serving config.asgi under an
+# ASGI server such as uvicorn; under WSGI each async view gets its own event loop.
+ASYNC_VIEWS = env.bool("ASYNC_VIEWS", default=False)
+
+# Request metrics (config.metrics): latency, SQL and render-time histograms on
+# /metrics, guarded by a bearer token, and slow-request logging with the
+# request's queries (0 disables it). Opt-in in production, where a token is
+# required so per-route traffic data is never public.
+METRICS_ENABLED = env.bool("METRICS_ENABLED", default=not DJANGO_PRODUCTION)
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
+if DJANGO_PRODUCTION and METRICS_ENABLED and not METRICS_TOKEN:
+    raise ImproperlyConfigured("METRICS_TOKEN must be set to enable METRICS_ENABLED in production.")
+SLOW_REQUEST_THRESHOLD_MS = env.float("SLOW_REQUEST_THRESHOLD_MS", default=1000.0)
+SLOW_REQUEST_MAX_QUERIES = env.int("SLOW_REQUEST_MAX_QUERIES", default=100)
+if METRICS_ENABLED:
+    MIDDLEWARE.insert(0, "config.metrics.MetricsMiddleware")
+if ASYNC_VIEWS:
+    # WhiteNoise is sync-only: Django would run every view below it in a
+    # worker thread. ASGI deployments serve static files from the front server.
+    MIDDLEWARE.remove("whitenoise.middleware.WhiteNoiseMiddleware")
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -81,6 +107,71 @@ DATABASES = {
     )
 }
 
+# Persistent connections are opt-in: keep each worker's connection open for
+# DB_CONN_MAX_AGE seconds ("None" never expires), or for a conn_max_age given in
+# DATABASE_URL; otherwise it is closed after every request. Kept connections
+# are pinged before reuse so a dropped one costs a reconnect rather than a
+# failed request. Under ASGI each request may land on a different thread, so
+# only an explicit DB_CONN_MAX_AGE keeps connections there; use DB_POOL instead.
+_conn_max_age = env("DB_CONN_MAX_AGE", default=None)
+if _conn_max_age is not None:
+    DATABASES["default"]["CONN_MAX_AGE"] = None if _conn_max_age == "None" else int(_conn_max_age)
+elif ASYNC_VIEWS or "CONN_MAX_AGE" not in DATABASES["default"]:
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = env.bool("DB_CONN_HEALTH_CHECKS", default=True)
+
+# psycopg's connection pool (DB_POOL=true) replaces persistent connections,
+# and suits ASGI where every sync_to_async thread would otherwise hold its own
+# connection. It needs Django 5.1+ and psycopg 3 on PostgreSQL.
+DB_POOL = env.bool("DB_POOL", default=False)
+if DB_POOL:
+    if DATABASES["default"]["ENGINE"] != "django.db.backends.postgresql":
+        raise ImproperlyConfigured("DB_POOL requires a PostgreSQL DATABASE_URL.")
+    if django.VERSION < (5, 1) or importlib.util.find_spec("psycopg_pool") is None:
+        raise ImproperlyConfigured("DB_POOL requires Django 5.1+ and psycopg[pool] (psycopg 3).")
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+        "min_size": env.int("DB_POOL_MIN_SIZE", default=2),
+        "max_size": env.int("DB_POOL_MAX_SIZE", default=10),
+        "timeout": env.float("DB_POOL_TIMEOUT", default=10.0),
+    }
+
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+
+DASHBOARD_STATS_CACHE_TTL = env.int("DASHBOARD_STATS_CACHE_TTL", default=60)
+TESTIMONIALS_CACHE_TTL = env.int("TESTIMONIALS_CACHE_TTL", default=300)
+
+# Password hashing: the first hasher hashes new passwords and existing hashes are
+# upgraded on the next login; the rest remain available to verify old hashes.
+PASSWORD_HASHER = env("PASSWORD_HASHER", default="pbkdf2")
+PASSWORD_HASHER_CLASSES = {
+    "pbkdf2": "users.hashers.TunedPBKDF2PasswordHasher",
+    "scrypt": "users.hashers.TunedScryptPasswordHasher",
+    "argon2": "users.hashers.TunedArgon2PasswordHasher",
+}
+if PASSWORD_HASHER not in PASSWORD_HASHER_CLASSES:
+    raise RuntimeError(f"Unknown PASSWORD_HASHER {PASSWORD_HASHER!r}")
+if PASSWORD_HASHER == "argon2" and importlib.util.find_spec("argon2") is None:
+    raise RuntimeError("PASSWORD_HASHER=argon2 requires the argon2-cffi package")
+PASSWORD_HASHERS = [PASSWORD_HASHER_CLASSES[PASSWORD_HASHER]] + [
+    path for name, path in PASSWORD_HASHER_CLASSES.items() if name != PASSWORD_HASHER
+] + [
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+]
+PASSWORD_PBKDF2_ITERATIONS = env.int("PASSWORD_PBKDF2_ITERATIONS", default=720000)
+PASSWORD_SCRYPT_WORK_FACTOR = env.int("PASSWORD_SCRYPT_WORK_FACTOR", default=2**14)
+PASSWORD_SCRYPT_BLOCK_SIZE = env.int("PASSWORD_SCRYPT_BLOCK_SIZE", default=8)
+PASSWORD_SCRYPT_PARALLELISM = env.int("PASSWORD_SCRYPT_PARALLELISM", default=1)
+PASSWORD_ARGON2_TIME_COST = env.int("PASSWORD_ARGON2_TIME_COST", default=2)
+PASSWORD_ARGON2_MEMORY_COST = env.int("PASSWORD_ARGON2_MEMORY_COST", default=102400)
+PASSWORD_ARGON2_PARALLELISM = env.int("PASSWORD_ARGON2_PARALLELISM", default=8)
+
+# Minimum seconds between last_login writes for the same user (users.last_login).
+LAST_LOGIN_UPDATE_INTERVAL = env.int("LAST_LOGIN_UPDATE_INTERVAL", default=300)
+
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
@@ -104,18 +195,99 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 AUTH_USER_MODEL = "users.User"
 
 REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": (
+        "config.metrics.TimedJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "users.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    # Reverse proxies in front of the app. Throttles identify clients by the
+    # X-Forwarded-For entry this many hops back, or by REMOTE_ADDR when 0, so
+    # a client cannot pick its own identity by sending the header. Behind a
+    # proxy this must be set, or every client shares the proxy's bucket; the
+    # throttle logs a warning when X-Forwarded-For arrives while it is 0.
+    "NUM_PROXIES": env.int("NUM_PROXIES", default=0),
 }
+if REST_FRAMEWORK["NUM_PROXIES"] < 0:
+    raise ImproperlyConfigured("NUM_PROXIES cannot be negative.")
+
+# Token bucket throttles (config.throttling), written as "<capacity>/<refill
+# period>". Scopes have a per-client bucket plus a global one, except login,
+# whose second bucket is per target account so one attacker cannot lock every
+# user out of signing in.
+TOKEN_BUCKET_THROTTLES = {
+    "contact": {
+        "ip": env("THROTTLE_CONTACT_IP", default="5/min"),
+        "global": env("THROTTLE_CONTACT_GLOBAL", default="60/min"),
+    },
+    "feedback": {
+        "ip": env("THROTTLE_FEEDBACK_IP", default="5/min"),
+        "global": env("THROTTLE_FEEDBACK_GLOBAL", default="60/min"),
+    },
+    "login": {
+        "ip": env("THROTTLE_LOGIN_IP", default="10/min"),
+        "account": env("THROTTLE_LOGIN_ACCOUNT", default="20/hour"),
+    },
+    "register": {
+        "ip": env("THROTTLE_REGISTER_IP", default="5/hour"),
+        "global": env("THROTTLE_REGISTER_GLOBAL", default="60/min"),
+    },
+}
+
+# Buffered contact ingestion (contact.spool); flushed inline once a batch fills
+# up or ages out, and by `manage.py flush_contact_spool` when traffic is idle.
+CONTACT_BUFFERED_INGEST = env.bool("CONTACT_BUFFERED_INGEST", default=False)
+CONTACT_SPOOL_PATH = env("CONTACT_SPOOL_PATH", default=str(BASE_DIR / "var" / "contact_spool.jsonl"))
+CONTACT_SPOOL_FSYNC = env.bool("CONTACT_SPOOL_FSYNC", default=True)
+CONTACT_BUFFER_BATCH_SIZE = env.int("CONTACT_BUFFER_BATCH_SIZE", default=100)
+CONTACT_BUFFER_FLUSH_INTERVAL = env.float("CONTACT_BUFFER_FLUSH_INTERVAL", default=5.0)
+
+# Seconds a token's user record may be served from cache (users.authentication).
+AUTH_USER_CACHE_TTL = env.int("AUTH_USER_CACHE_TTL", default=60)
 
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=30),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
 }
 
+EMAIL_BACKEND = env("EMAIL_BACKEND", default="django.core.mail.backends.smtp.EmailBackend")
+EMAIL_HOST = env("EMAIL_HOST", default="localhost")
+EMAIL_PORT = env.int("EMAIL_PORT", default=25)
+EMAIL_HOST_USER = env("EMAIL_HOST_USER", default="")
+EMAIL_HOST_PASSWORD = env("EMAIL_HOST_PASSWORD", default="")
+EMAIL_USE_TLS = env.bool("EMAIL_USE_TLS", default=False)
+EMAIL_FILE_PATH = env("EMAIL_FILE_PATH", default=str(BASE_DIR / "sent_emails"))
+DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL", default=EMAIL_HOST_USER)
+
+# Notification outbox (drained by `manage.py process_notifications`)
+NOTIFICATION_OUTBOX_BATCH_SIZE = env.int("NOTIFICATION_OUTBOX_BATCH_SIZE", default=50)
+NOTIFICATION_OUTBOX_MAX_ATTEMPTS = env.int("NOTIFICATION_OUTBOX_MAX_ATTEMPTS", default=5)
+NOTIFICATION_OUTBOX_RETRY_BACKOFF = env.int("NOTIFICATION_OUTBOX_RETRY_BACKOFF", default=60)
+NOTIFICATION_OUTBOX_POLL_INTERVAL = env.float("NOTIFICATION_OUTBOX_POLL_INTERVAL", default=5.0)
+NOTIFICATION_BATCH_SIZE = env.int("NOTIFICATION_BATCH_SIZE", default=100)
+
+# Automatic reminders (events.reminders): minutes before `event_date` at which
+# the `run_reminder_scheduler` worker queues a reminder, how far ahead (in
+# seconds) it loads due reminders into memory, and the grace period (seconds)
+# within which a nearer reminder replaces an overdue one.
+EVENT_REMINDER_OFFSETS = env.list("EVENT_REMINDER_OFFSETS", cast=int, default=[1440, 60])
+EVENT_REMINDER_HORIZON = env.int("EVENT_REMINDER_HORIZON", default=3600)
+EVENT_REMINDER_GRACE = env.int("EVENT_REMINDER_GRACE", default=300)
+EVENT_REMINDER_POLL_INTERVAL = env.float("EVENT_REMINDER_POLL_INTERVAL", default=30.0)
+
+# Bulk event import/export (events.bulk)
+EVENT_IMPORT_CHUNK_SIZE = env.int("EVENT_IMPORT_CHUNK_SIZE", default=1000)
+EVENT_IMPORT_DIGEST_SIZE = env.int("EVENT_IMPORT_DIGEST_SIZE", default=20)
+EVENT_EXPORT_CHUNK_SIZE = env.int("EVENT_EXPORT_CHUNK_SIZE", default=2000)
+
+# iCalendar feeds (events.ical); rendered VEVENT blocks are cached per
+# (event, updated_at) so a refresh only re-renders edited events.
+ICAL_FEED_CHUNK_SIZE = env.int("ICAL_FEED_CHUNK_SIZE", default=500)
+ICAL_VEVENT_CACHE_TTL = env.int("ICAL_VEVENT_CACHE_TTL", default=86400)
+
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
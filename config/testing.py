@@ -0,0 +1,61 @@
+"""
+Test helpers for pinning the cost of API endpoints.
+
+`config.seeding.seed_data` builds a dataset large enough that an N+1 query
+pattern blows any sensible budget, and `QueryBudgetTestCase.assertWithinBudget`
+runs a request while counting its SQL queries and timing it. Budgets are
+checked on SQLite, so the suite runs offline; set `QUERY_BUDGET_LATENCY_SCALE`
+to loosen the latency ceilings on slow machines.
+"""
+import os
+import time
+from dataclasses import dataclass
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, get_resolver
+from rest_framework.test import APITestCase
+
+LATENCY_SCALE = float(os.environ.get('QUERY_BUDGET_LATENCY_SCALE', '1'))
+
+
+@dataclass(frozen=True)
+class Budget:
+    queries: int
+    max_ms: float = 500
+
+
+def named_routes(patterns=None, excluded_namespaces=('admin',)) -> set[str]:
+    """Names of every URL pattern reachable from the root URLconf."""
+    names = set()
+    for pattern in get_resolver().url_patterns if patterns is None else patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.namespace not in excluded_namespaces:
+                names |= named_routes(pattern.url_patterns, excluded_namespaces)
+        elif pattern.name:
+            names.add(pattern.name)
+    return names
+
+
+class QueryBudgetTestCase(APITestCase):
+    def assertWithinBudget(self, budget: Budget, request):
+        """
+        Call `request()` and fail if it runs more than `budget.queries` SQL
+        queries or takes longer than `budget.max_ms`. Streaming bodies are
+        consumed inside the measurement, since that is when they query.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response = request()
+            if response.streaming:
+                response.content_bytes = b''.join(response.streaming_content)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+        self.assertLess(response.status_code, 400, getattr(response, 'data', response))
+        self.assertLessEqual(
+            len(queries),
+            budget.queries,
+            f"{len(queries)} queries, budget {budget.queries}:\n" + '\n'.join(query['sql'] for query in queries.captured_queries),
+        )
+        self.assertLessEqual(elapsed_ms, budget.max_ms * LATENCY_SCALE, f"{elapsed_ms:.1f} ms, ceiling {budget.max_ms} ms")
+        return response
@@ -0,0 +1,224 @@
+import os
+import runpy
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from events.models import CalendarFeedToken, Event
+
+from .metrics import registry
+from .seeding import BENCHMARK_PASSWORD, seed_data
+from .testing import Budget, QueryBudgetTestCase, named_routes
+
+User = get_user_model()
+
+
+class MetricsTests(APITestCase):
+    def setUp(self):
+        registry.reset()
+        owner = User.objects.create_user(username='owner@example.com', email='owner@example.com', password='pass12345')
+        Event.objects.create(title='Launch', event_date=timezone.now(), created_by=owner)
+
+    def _metrics(self):
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/plain; version=0.0.4; charset=utf-8')
+        return dict(line.rsplit(' ', 1) for line in response.content.decode().splitlines() if not line.startswith('#'))
+
+    def test_requests_are_recorded_per_route_with_queries_and_render_time(self):
+        self.client.get(reverse('event-list-create'))
+        self.client.get(reverse('event-list-create'))
+        self.client.get(reverse('event-detail', args=[999]))
+
+        samples = self._metrics()
+
+        labels = '{method="GET",route="api/events/",status="200"}'
+        self.assertEqual(samples[f'http_request_duration_seconds_count{labels}'], '2')
+        # The page query only; its rows double as the conditional GET validators.
+        self.assertEqual(float(samples[f'http_request_db_queries_sum{labels}']), 2)
+        self.assertEqual(samples['http_request_db_queries_bucket{method="GET",route="api/events/",status="200",le="1"}'], '2')
+        self.assertGreater(float(samples[f'http_request_render_duration_seconds_sum{labels}']), 0)
+        self.assertEqual(samples['http_request_duration_seconds_count{method="GET",route="api/events/<int:pk>/",status="404"}'], '1')
+
+    def test_unknown_methods_share_one_label(self):
+        self.client.generic('FOO', reverse('event-list-create'))
+        self.client.generic('BAR', reverse('event-list-create'))
+
+        samples = self._metrics()
+
+        self.assertEqual(samples['http_request_duration_seconds_count{method="OTHER",route="api/events/",status="401"}'], '2')
+        self.assertFalse(any('method="FOO"' in name for name in samples))
+
+    @override_settings(SLOW_REQUEST_THRESHOLD_MS=0.001)
+    def test_slow_requests_are_logged_with_their_queries(self):
+        with self.assertLogs('config.metrics', level='WARNING') as logs:
+            self.client.get(reverse('event-list-create'))
+
+        self.assertIn('Slow request GET /api/events/ -> 200', logs.output[0])
+        self.assertIn('FROM "events_event"', logs.output[0])
+
+    @override_settings(METRICS_TOKEN='scrape-secret')
+    def test_metrics_endpoint_can_require_a_token(self):
+        denied = self.client.get(reverse('metrics'))
+        allowed = self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer scrape-secret')
+
+        self.assertEqual(denied.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(allowed.status_code, status.HTTP_200_OK)
+
+
+class DatabaseSettingsTests(SimpleTestCase):
+    settings_path = os.path.join(os.path.dirname(__file__), 'settings.py')
+
+    def load(self, **environ):
+        inherited = {
+            key: value for key, value in os.environ.items()
+            if not key.startswith(('DB_', 'DATABASE_URL', 'ASYNC_VIEWS', 'DJANGO_PRODUCTION'))
+        }
+        with mock.patch.dict(os.environ, {**inherited, **environ}, clear=True):
+            return runpy.run_path(self.settings_path)['DATABASES']['default']
+
+    def test_connections_close_after_each_request_by_default(self):
+        self.assertEqual(self.load()['CONN_MAX_AGE'], 0)
+
+    def test_database_url_max_age_is_kept_unless_overridden(self):
+        url = 'postgres://app:secret@db/app?conn_max_age=30'
+
+        self.assertEqual(self.load(DATABASE_URL=url)['CONN_MAX_AGE'], 30)
+        self.assertEqual(self.load(DATABASE_URL=url, DB_CONN_MAX_AGE='5')['CONN_MAX_AGE'], 5)
+        self.assertIsNone(self.load(DATABASE_URL=url, DB_CONN_MAX_AGE='None')['CONN_MAX_AGE'])
+
+    def test_async_views_keep_connections_only_when_asked(self):
+        url = 'postgres://app:secret@db/app?conn_max_age=30'
+
+        self.assertEqual(self.load(DATABASE_URL=url, ASYNC_VIEWS='true')['CONN_MAX_AGE'], 0)
+        self.assertEqual(self.load(ASYNC_VIEWS='true', DB_CONN_MAX_AGE='60')['CONN_MAX_AGE'], 60)
+
+    def test_pool_requires_postgresql(self):
+        with self.assertRaisesMessage(ImproperlyConfigured, 'DB_POOL requires a PostgreSQL DATABASE_URL.'):
+            self.load(DB_POOL='true')
+
+
+BUDGETS = {
+    ('user-register', 'POST'): Budget(queries=2, max_ms=1500),
+    ('user-login', 'POST'): Budget(queries=3, max_ms=1500),
+    ('user-profile', 'GET'): Budget(queries=2),
+    ('user-forgot-password', 'POST'): Budget(queries=0),
+    ('token_refresh', 'POST'): Budget(queries=1),
+    ('event-list-create', 'GET'): Budget(queries=2),
+    ('event-list-create', 'POST'): Budget(queries=4),
+    ('event-import', 'POST'): Budget(queries=8),
+    ('event-export', 'GET'): Budget(queries=1),
+    ('event-feed', 'GET'): Budget(queries=4),
+    ('user-event-feed', 'GET'): Budget(queries=5),
+    ('event-feed-token', 'GET'): Budget(queries=5),
+    ('event-feed-token', 'POST'): Budget(queries=4),
+    ('event-feed-token', 'DELETE'): Budget(queries=1),
+    ('event-search', 'GET'): Budget(queries=3),
+    ('event-detail', 'GET'): Budget(queries=2),
+    ('event-detail', 'PATCH'): Budget(queries=4),
+    ('event-reminder', 'POST'): Budget(queries=3),
+    ('dashboard-stats', 'GET'): Budget(queries=4),
+    ('feedback-list', 'GET'): Budget(queries=1),
+    ('feedback-list', 'POST'): Budget(queries=2),
+    ('feedback-detail', 'GET'): Budget(queries=1),
+    ('feedback-testimonials', 'GET'): Budget(queries=3),
+    ('contact-create', 'POST'): Budget(queries=1),
+    ('metrics', 'GET'): Budget(queries=0),
+}
+# Routes with no budget of their own: the router's API root is shadowed by
+# `feedback-list`, which is registered on the same empty prefix.
+UNBUDGETED_ROUTES = {'api-root'}
+
+
+@override_settings(TOKEN_BUCKET_THROTTLES={}, CONTACT_BUFFERED_INGEST=False)
+class RouteQueryBudgetTests(QueryBudgetTestCase):
+    """
+    Every route, against 1000 events, 25 users and 200 feedback entries, with
+    a fresh cache and real JWT authentication (so the first authenticated
+    request pays for the user lookup).
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.data = seed_data(users=25, events=1000, feedback=200, contacts=0)
+        cls.owner = cls.data.users[0]
+        cls.event = next(event for event in cls.data.events if event.created_by_id == cls.owner.pk)
+
+    def setUp(self):
+        cache.clear()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.owner)}')
+
+    def check(self, name, method, *args, data=None, **kwargs):
+        url = reverse(name, args=args)
+        call = getattr(self.client, method.lower())
+        return self.assertWithinBudget(BUDGETS[name, method], lambda: call(url, data, **kwargs))
+
+    def test_every_route_has_a_budget(self):
+        budgeted = {name for name, _ in BUDGETS}
+
+        self.assertEqual(named_routes() - UNBUDGETED_ROUTES, budgeted)
+
+    def test_user_routes(self):
+        self.client.credentials()
+        self.check('user-register', 'POST', data={
+            'email': 'new@example.com', 'password': 'pass12345', 'confirm_password': 'pass12345',
+            'first_name': 'New', 'last_name': 'User',
+        }, format='json')
+        login = self.check('user-login', 'POST', data={'email': self.owner.email, 'password': BENCHMARK_PASSWORD}, format='json')
+        self.check('user-forgot-password', 'POST', data={'email': self.owner.email}, format='json')
+        self.check('token_refresh', 'POST', data={'refresh': login.data['refresh']}, format='json')
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {login.data['access']}")
+        self.check('user-profile', 'GET')
+
+    def test_event_collection_routes(self):
+        self.check('event-list-create', 'GET', data={'page_size': 200})
+        self.check('event-list-create', 'POST', data={'title': 'Launch', 'event_date': '2030-01-01T10:00:00Z'}, format='json')
+        self.check('event-search', 'GET', data={'q': 'roadmap', 'limit': 100})
+        self.check('event-export', 'GET')
+
+    def test_event_import(self):
+        body = 'title,event_date\n' + ''.join(f'Imported {index},2030-01-01T10:00:00Z\n' for index in range(200))
+
+        self.check('event-import', 'POST', data=body, content_type='text/csv')
+
+    def test_event_feeds(self):
+        feed_token = CalendarFeedToken.objects.create(user=self.owner)
+        self.client.credentials()
+        self.check('event-feed', 'GET')
+        self.check('user-event-feed', 'GET', feed_token.token)
+
+    def test_event_feed_token(self):
+        self.check('event-feed-token', 'GET')
+        self.check('event-feed-token', 'POST')
+        self.check('event-feed-token', 'DELETE')
+
+    def test_event_detail_routes(self):
+        self.check('event-detail', 'GET', self.event.pk)
+        self.check('event-detail', 'PATCH', self.event.pk, data={'title': 'Renamed'}, format='json')
+        self.check('event-reminder', 'POST', self.event.pk)
+
+    def test_dashboard_stats(self):
+        self.owner.is_admin = True
+        self.owner.save(update_fields=['is_admin'])
+
+        self.check('dashboard-stats', 'GET')
+
+    def test_feedback_routes(self):
+        self.client.credentials()
+        self.check('feedback-list', 'GET')
+        self.check('feedback-list', 'POST', data={'name': 'Ada', 'quote': 'Great', 'rating': 5}, format='json')
+        self.check('feedback-detail', 'GET', self.data.feedback[0].pk)
+        self.check('feedback-testimonials', 'GET')
+
+    def test_contact_and_metrics(self):
+        self.client.credentials()
+        self.check('contact-create', 'POST', data={'name': 'Ada', 'email': 'ada@example.com', 'message': 'Hi'}, format='json')
+        self.check('metrics', 'GET')
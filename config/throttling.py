@@ -0,0 +1,119 @@
+import hashlib
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import permissions
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+DURATIONS = {'s': 1, 'sec': 1, 'm': 60, 'min': 60, 'h': 3600, 'hour': 3600, 'd': 86400, 'day': 86400}
+BUCKETS = ('ip', 'account', 'global')
+
+_warned_about_proxies = False
+
+
+def parse_rate(rate: str) -> tuple[int, float]:
+    """Turn '10/min' into (capacity, tokens refilled per second)."""
+    try:
+        count, period = rate.split('/')
+        capacity = int(count)
+        return capacity, capacity / DURATIONS[period]
+    except (KeyError, ValueError):
+        raise ImproperlyConfigured(f"Invalid token bucket rate: {rate!r}")
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Per-client, per-account and global token buckets stored in the default
+    cache. Each bucket holds up to `capacity` tokens and refills continuously at
+    its rate, so short bursts are absorbed while the sustained write rate stays
+    capped. The `account` bucket is keyed on the `account_field` value in the
+    request body (the email a login targets), so a distributed attacker is
+    capped per account without one shared bucket locking everyone out.
+
+    A request spends one token from every configured bucket, and only when all
+    of them have one, so a client rejected by its own bucket cannot drain the
+    others. Rates live in `settings.TOKEN_BUCKET_THROTTLES[scope]`. The cache
+    update is a plain get/set, so concurrent workers may admit a few requests
+    over budget.
+    """
+
+    scope = None
+    write_only = True
+    account_field = 'email'
+
+    def __init__(self):
+        rates = getattr(settings, 'TOKEN_BUCKET_THROTTLES', {}).get(self.scope, {})
+        self.rates = {bucket: parse_rate(rates[bucket]) for bucket in BUCKETS if rates.get(bucket)}
+        self.waits = []
+
+    def get_cache_key(self, request, bucket):
+        if bucket == 'global':
+            return f'throttle:bucket:{self.scope}:global'
+        if bucket == 'account':
+            account = request.data.get(self.account_field) if hasattr(request.data, 'get') else None
+            if not isinstance(account, str) or not account.strip():
+                return None
+            # Hashed so cache keys stay short and never hold addresses.
+            digest = hashlib.sha256(account.strip().lower().encode()).hexdigest()
+            return f'throttle:bucket:{self.scope}:account:{digest}'
+        # `get_ident` only trusts X-Forwarded-For as far as REST_FRAMEWORK's
+        # NUM_PROXIES allows; otherwise it is REMOTE_ADDR.
+        self._check_proxies(request)
+        return f'throttle:bucket:{self.scope}:client:{self.get_ident(request)}'
+
+    @staticmethod
+    def _check_proxies(request):
+        global _warned_about_proxies
+        if _warned_about_proxies or api_settings.NUM_PROXIES or 'HTTP_X_FORWARDED_FOR' not in request.META:
+            return
+        _warned_about_proxies = True
+        logger.warning(
+            "Requests carry X-Forwarded-For but NUM_PROXIES is 0, so throttles key clients on "
+            "REMOTE_ADDR. Behind a reverse proxy every client then shares one bucket; set "
+            "NUM_PROXIES to the number of proxies in front of the app."
+        )
+
+    def allow_request(self, request, view):
+        if not self.rates:
+            return True
+        if self.write_only and request.method in permissions.SAFE_METHODS:
+            return True
+
+        now = time.time()
+        keys = {bucket: self.get_cache_key(request, bucket) for bucket in self.rates}
+        rates = {bucket: rate for bucket, rate in self.rates.items() if keys[bucket] is not None}
+        stored = cache.get_many([keys[bucket] for bucket in rates])
+        tokens = {}
+        for bucket, (capacity, refill_rate) in rates.items():
+            available, updated_at = stored.get(keys[bucket], (capacity, now))
+            tokens[bucket] = min(capacity, available + (now - updated_at) * refill_rate)
+
+        self.waits = [
+            (1 - tokens[bucket]) / refill_rate
+            for bucket, (_, refill_rate) in rates.items()
+            if tokens[bucket] < 1
+        ]
+        allowed = not self.waits
+        for bucket, (capacity, refill_rate) in rates.items():
+            if allowed:
+                tokens[bucket] -= 1
+            cache.set(keys[bucket], (tokens[bucket], now), timeout=int(capacity / refill_rate) + 1)
+        return allowed
+
+    def wait(self):
+        return max(self.waits) if self.waits else None
+
+
+def token_bucket_throttle(scope: str, write_only: bool = True) -> type:
+    """Build a `TokenBucketThrottle` subclass for `scope`, for `throttle_classes`."""
+    return type(
+        f'{scope.title()}TokenBucketThrottle',
+        (TokenBucketThrottle,),
+        {'scope': scope, 'write_only': write_only},
+    )
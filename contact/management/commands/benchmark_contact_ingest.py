@@ -0,0 +1,59 @@
+import tempfile
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory
+
+from contact.models import Contact
+from contact.spool import ContactSpool
+from contact.views import contact_create
+
+BENCHMARK_EMAIL = 'ingest@benchmark.invalid'
+
+
+class Command(BaseCommand):
+    help = "Compare rows/second of direct contact inserts against buffered spool ingestion."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=2000)
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument('--no-fsync', action='store_true', help="Skip fsync on spool appends.")
+
+    def handle(self, *args, **options):
+        factory = APIRequestFactory()
+        payload = {'name': 'Benchmark', 'email': BENCHMARK_EMAIL, 'message': 'Load test submission'}
+        rows = options['rows']
+
+        def submit():
+            for _ in range(rows):
+                contact_create(factory.post('/api/contact/', payload, format='json'))
+
+        try:
+            with override_settings(TOKEN_BUCKET_THROTTLES={}, CONTACT_BUFFERED_INGEST=False):
+                direct = self._timed(submit)
+            self._report('direct INSERT per request', rows, direct)
+
+            with tempfile.TemporaryDirectory() as spool_dir:
+                spool_path = Path(spool_dir) / 'contact.jsonl'
+                with override_settings(
+                    TOKEN_BUCKET_THROTTLES={},
+                    CONTACT_BUFFERED_INGEST=True,
+                    CONTACT_SPOOL_PATH=str(spool_path),
+                    CONTACT_SPOOL_FSYNC=not options['no_fsync'],
+                    CONTACT_BUFFER_BATCH_SIZE=options['batch_size'],
+                ):
+                    buffered = self._timed(lambda: (submit(), ContactSpool().flush()))
+            self._report(f"buffered spool (batch {options['batch_size']})", rows, buffered)
+        finally:
+            Contact.objects.filter(email=BENCHMARK_EMAIL).delete()
+
+    @staticmethod
+    def _timed(func):
+        started = time.perf_counter()
+        func()
+        return time.perf_counter() - started
+
+    def _report(self, label, rows, elapsed):
+        self.stdout.write(f"{label:<32} {rows / elapsed:>10.0f} rows/s  ({elapsed:.2f} s)")
@@ -0,0 +1,24 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from contact.spool import contact_spool
+
+
+class Command(BaseCommand):
+    help = "Write buffered contact submissions from the spool file to the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help="Keep flushing every --interval seconds.")
+        parser.add_argument('--interval', type=float, default=None)
+
+    def handle(self, *args, **options):
+        interval = options['interval'] if options['interval'] is not None else settings.CONTACT_BUFFER_FLUSH_INTERVAL
+        while True:
+            written = contact_spool.flush()
+            if written or not options['loop']:
+                self.stdout.write(f"Flushed {written} contact submission(s).")
+            if not options['loop']:
+                return
+            time.sleep(interval)
@@ -1,10 +1,12 @@
 from django.db import models
+from django.utils import timezone
 
 class Contact(models.Model):
     name = models.CharField(max_length=100)
     email = models.EmailField()
     message = models.TextField()
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Not auto_now_add: buffered ingest sets it to when the message was received.
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
 
     def __str__(self):
         return self.name
@@ -0,0 +1,154 @@
+"""
+Durable spool for buffered contact ingestion.
+
+Accepted submissions are appended as JSON lines (fsync'd), stamped with the
+time they were received, and later written to the database in `bulk_create`
+batches. The flush triggers are shared by every worker process: the number of
+pending lines is kept in a small counter file next to the spool, updated under
+the append lock, and the age comes from the spool's first line, so checking
+them never reads the whole backlog. A flush renames the spool aside before
+reading it, so new submissions keep appending while the batch is inserted. If
+a process dies mid-flush the renamed file is picked up by the next flush; rows
+from a batch whose commit landed just before the crash may be inserted twice.
+"""
+import json
+import logging
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import Contact
+
+logger = logging.getLogger(__name__)
+
+
+class ContactSpool:
+    def __init__(self, path=None):
+        self._path = path
+
+    @property
+    def path(self) -> Path:
+        return Path(self._path or settings.CONTACT_SPOOL_PATH)
+
+    @property
+    def processing_path(self) -> Path:
+        return self.path.with_name(self.path.name + '.processing')
+
+    @property
+    def count_path(self) -> Path:
+        return self.path.with_name(self.path.name + '.count')
+
+    @contextmanager
+    def _lock(self, name, blocking=True):
+        # POSIX-only, and only needed once buffered ingest is switched on.
+        import fcntl
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_name(f'{self.path.name}.{name}.lock'), 'w') as handle:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def append(self, record: dict) -> None:
+        line = json.dumps({**record, 'created_at': timezone.now().isoformat()}, default=str) + '\n'
+        with self._lock('append'):
+            pending = self._pending()
+            with open(self.path, 'a', encoding='utf-8') as handle:
+                handle.write(line)
+                handle.flush()
+                if settings.CONTACT_SPOOL_FSYNC:
+                    os.fsync(handle.fileno())
+            self.count_path.write_text(str(pending + 1))
+
+    def should_flush(self) -> bool:
+        with self._lock('append'):
+            pending = self._pending()
+            if not pending:
+                return False
+            if pending >= settings.CONTACT_BUFFER_BATCH_SIZE:
+                return True
+            with open(self.path, encoding='utf-8') as handle:
+                first = handle.readline()
+        try:
+            received_at = parse_datetime(json.loads(first)['created_at'])
+        except (ValueError, TypeError, KeyError):
+            # Unreadable or pre-timestamp head line; let a flush deal with it.
+            return True
+        if received_at is None:
+            return True
+        return (timezone.now() - received_at).total_seconds() >= settings.CONTACT_BUFFER_FLUSH_INTERVAL
+
+    def flush(self) -> int:
+        """Insert every spooled submission; returns the number of rows written."""
+        with self._lock('flush', blocking=False) as acquired:
+            if not acquired:
+                return 0
+            written = 0
+            if self.processing_path.exists():
+                written += self._load(self.processing_path)
+            with self._lock('append'):
+                if not self.path.exists() or not self.path.stat().st_size:
+                    return written
+                os.replace(self.path, self.processing_path)
+                self.count_path.unlink(missing_ok=True)
+            written += self._load(self.processing_path)
+            return written
+
+    def _pending(self) -> int:
+        """Lines in the spool; call with the append lock held."""
+        if not self.path.exists():
+            return 0
+        try:
+            return int(self.count_path.read_text())
+        except (FileNotFoundError, ValueError):
+            # Spool written before the counter existed, or a torn counter write.
+            with open(self.path, encoding='utf-8') as handle:
+                pending = sum(1 for line in handle if line.strip())
+            self.count_path.write_text(str(pending))
+            return pending
+
+    @staticmethod
+    def _contact(line: str) -> Contact:
+        data = json.loads(line)
+        # Keep the time the submission was received, not the time of the flush.
+        received_at = parse_datetime(data.pop('created_at', None) or '')
+        if received_at is not None:
+            data['created_at'] = received_at
+        return Contact(**data)
+
+    def _load(self, path: Path) -> int:
+        batch_size = settings.CONTACT_BUFFER_BATCH_SIZE
+        written = 0
+        with transaction.atomic():
+            batch = []
+            with open(path, encoding='utf-8') as handle:
+                for line_number, line in enumerate(handle, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        batch.append(self._contact(line))
+                    except (ValueError, TypeError) as exc:
+                        # A torn final write from a crash; skip it rather than block the spool.
+                        logger.warning("Skipping unreadable contact spool line %s: %s", line_number, exc)
+                        continue
+                    if len(batch) >= batch_size:
+                        written += len(Contact.objects.bulk_create(batch))
+                        batch = []
+            if batch:
+                written += len(Contact.objects.bulk_create(batch))
+        path.unlink()
+        return written
+
+
+contact_spool = ContactSpool()
@@ -1,3 +1,157 @@
-from django.test import TestCase
+import json
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from config.throttling import token_bucket_throttle
+
+from .models import Contact
+from .spool import ContactSpool, contact_spool
+
+FLOOD_THROTTLES = {'contact': {'ip': '5/min', 'global': '20/min'}}
+
+
+@override_settings(TOKEN_BUCKET_THROTTLES=FLOOD_THROTTLES)
+class ContactThrottleTests(APITestCase):
+    payload = {'name': 'Bot', 'email': 'bot@example.com', 'message': 'Buy now'}
+
+    def setUp(self):
+        cache.clear()
+
+    def test_single_client_flood_is_capped_by_its_bucket(self):
+        responses = [self.client.post(reverse('contact-create'), self.payload, format='json') for _ in range(50)]
+
+        self.assertEqual(Contact.objects.count(), 5)
+        self.assertEqual(responses[-1].status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn('Retry-After', responses[-1])
+
+    def test_distributed_flood_is_capped_by_the_global_bucket(self):
+        for index in range(200):
+            self.client.post(reverse('contact-create'), self.payload, format='json', REMOTE_ADDR=f'10.0.{index // 250}.{index % 250}')
+
+        self.assertEqual(Contact.objects.count(), 20)
+
+    def test_rejected_clients_do_not_drain_the_global_bucket(self):
+        for _ in range(50):
+            self.client.post(reverse('contact-create'), self.payload, format='json', REMOTE_ADDR='10.9.9.9')
+
+        response = self.client.post(reverse('contact-create'), self.payload, format='json', REMOTE_ADDR='10.1.1.1')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_spoofed_forwarded_for_does_not_reset_the_client_bucket(self):
+        for index in range(10):
+            self.client.post(reverse('contact-create'), self.payload, format='json', HTTP_X_FORWARDED_FOR=f'203.0.113.{index}')
+
+        self.assertEqual(Contact.objects.count(), 5)
+
+    def test_forwarded_for_without_num_proxies_is_reported(self):
+        with mock.patch('config.throttling._warned_about_proxies', False):
+            with self.assertLogs('config.throttling', level='WARNING') as logs:
+                self.client.post(reverse('contact-create'), self.payload, format='json', HTTP_X_FORWARDED_FOR='203.0.113.7')
+
+        self.assertIn('NUM_PROXIES is 0', logs.output[0])
+
+    def test_client_named_global_has_its_own_bucket(self):
+        throttle = token_bucket_throttle('contact')()
+        request = APIRequestFactory().post('/', REMOTE_ADDR='global')
+
+        self.assertNotEqual(throttle.get_cache_key(request, 'ip'), throttle.get_cache_key(request, 'global'))
+
+
+class BufferedIngestTests(APITestCase):
+    payload = {'name': 'Ada', 'email': 'ada@example.com', 'message': 'Hello'}
+
+    def setUp(self):
+        spool_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(spool_dir.cleanup)
+        self.spool_path = Path(spool_dir.name) / 'contact.jsonl'
+        settings_override = override_settings(
+            CONTACT_BUFFERED_INGEST=True,
+            CONTACT_SPOOL_PATH=str(self.spool_path),
+            CONTACT_SPOOL_FSYNC=False,
+            CONTACT_BUFFER_BATCH_SIZE=3,
+            CONTACT_BUFFER_FLUSH_INTERVAL=3600,
+            TOKEN_BUCKET_THROTTLES={},
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_submissions_are_acknowledged_then_flushed_in_batches(self):
+        first = self.client.post(reverse('contact-create'), self.payload, format='json')
+        self.client.post(reverse('contact-create'), self.payload, format='json')
+
+        self.assertEqual(first.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(Contact.objects.count(), 0)
+        self.assertEqual(len(self.spool_path.read_text().splitlines()), 2)
+
+        self.client.post(reverse('contact-create'), self.payload, format='json')
+
+        self.assertEqual(Contact.objects.count(), 3)
+        self.assertFalse(self.spool_path.exists())
+
+    def test_flush_triggers_are_shared_across_processes(self):
+        other_worker = ContactSpool(self.spool_path)
+        contact_spool.append(self.payload)
+        contact_spool.append(self.payload)
+
+        self.assertFalse(other_worker.should_flush())
+        other_worker.append(self.payload)
+        self.assertTrue(contact_spool.should_flush())
+
+    def test_failed_flush_still_accepts_and_keeps_the_batch(self):
+        self.client.post(reverse('contact-create'), self.payload, format='json')
+        self.client.post(reverse('contact-create'), self.payload, format='json')
+        with mock.patch.object(Contact.objects, 'bulk_create', side_effect=DatabaseError('database is down')):
+            with self.assertLogs('contact.views', level='ERROR'):
+                response = self.client.post(reverse('contact-create'), self.payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(Contact.objects.count(), 0)
+        self.assertEqual(contact_spool.flush(), 3)
+
+    def test_pending_count_is_tracked_beside_the_spool(self):
+        contact_spool.append(self.payload)
+        contact_spool.append(self.payload)
+
+        self.assertEqual(contact_spool.count_path.read_text(), '2')
+        contact_spool.flush()
+        self.assertFalse(contact_spool.count_path.exists())
+
+    def test_flushed_rows_keep_their_received_time(self):
+        received_at = timezone.now() - timedelta(hours=1)
+        with mock.patch('contact.spool.timezone.now', return_value=received_at):
+            contact_spool.append(self.payload)
+
+        with override_settings(CONTACT_BUFFER_FLUSH_INTERVAL=60):
+            self.assertTrue(contact_spool.should_flush())
+        contact_spool.flush()
+
+        self.assertEqual(Contact.objects.get().created_at, received_at)
+
+    def test_invalid_submissions_are_not_spooled(self):
+        response = self.client.post(reverse('contact-create'), {'name': 'Ada'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(self.spool_path.exists())
+
+    def test_flush_command_recovers_an_interrupted_flush(self):
+        processing = self.spool_path.with_name(self.spool_path.name + '.processing')
+        processing.write_text(json.dumps(self.payload) + '\n' + '{"name": "torn')
+        self.client.post(reverse('contact-create'), self.payload, format='json')
+
+        call_command('flush_contact_spool', stdout=StringIO())
+
+        self.assertEqual(Contact.objects.count(), 2)
+        self.assertFalse(processing.exists())
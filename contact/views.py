@@ -1,14 +1,36 @@
-from rest_framework.decorators import api_view, permission_classes
+import logging
+
+from django.conf import settings
+from django.db import DatabaseError
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework import status
+
+from config.throttling import token_bucket_throttle
 from .serializers import ContactSerializer
+from .spool import contact_spool
+
+logger = logging.getLogger(__name__)
+
 
 @api_view(["POST"])
 @permission_classes([AllowAny])  
+@throttle_classes([token_bucket_throttle("contact")])
 def contact_create(request):
     serializer = ContactSerializer(data=request.data)
     if serializer.is_valid():
+        if settings.CONTACT_BUFFERED_INGEST:
+            contact_spool.append(serializer.validated_data)
+            if contact_spool.should_flush():
+                # The submission is already spooled; a failed flush is retried by
+                # the next one, and a 500 here would only make clients resubmit.
+                try:
+                    contact_spool.flush()
+                except (DatabaseError, OSError):
+                    logger.exception("Contact spool flush failed; submissions stay spooled.")
+            return Response({"message": "Accepted"}, status=status.HTTP_202_ACCEPTED)
+
         serializer.save()
         return Response({"message": "Saved"}, status=status.HTTP_201_CREATED)
 
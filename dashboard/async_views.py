@@ -0,0 +1,36 @@
+from django.utils import timezone
+from rest_framework import permissions, status
+from rest_framework.response import Response
+
+from config.async_views import AsyncAPIView
+
+from .buckets import acount_by_bucket
+from .cache import aget_cached_stats, aset_cached_stats, astats_cache_key
+from .views import build_stats, parse_breakdown_query, recent_events_queryset, stats_queryset, summary_aggregates
+
+
+class AsyncDashboardStatsView(AsyncAPIView):
+    """Async `DashboardStatsView`, sharing its cache entries."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    async def get(self, request):
+        user = request.user
+        granularity, bucket_count = parse_breakdown_query(request)
+
+        cache_key = await astats_cache_key(user, granularity, bucket_count)
+        stats = await aget_cached_stats(cache_key)
+        if stats is not None:
+            return Response(stats, status=status.HTTP_200_OK)
+
+        now = timezone.now()
+        base_queryset = stats_queryset(user)
+        stats = build_stats(
+            await base_queryset.aaggregate(**summary_aggregates(now)),
+            [event async for event in recent_events_queryset(base_queryset)],
+            await acount_by_bucket(base_queryset, 'event_date', granularity, bucket_count, now=now),
+            granularity,
+        )
+        await aset_cached_stats(cache_key, stats)
+
+        return Response(stats, status=status.HTTP_200_OK)
@@ -0,0 +1,107 @@
+from datetime import datetime, time, timedelta
+
+from django.db.models import Count
+from django.db.models.functions import Trunc
+from django.utils import timezone
+
+GRANULARITIES = ('day', 'week', 'month', 'quarter')
+DEFAULT_RANGES = {'day': 14, 'week': 8, 'month': 6, 'quarter': 4}
+MAX_RANGE = 366
+
+
+def _shift_months(day, months):
+    month_index = day.year * 12 + day.month - 1 + months
+    return day.replace(year=month_index // 12, month=month_index % 12 + 1, day=1)
+
+
+def bucket_floor(day, granularity):
+    """Return the first local date of the bucket containing `day`."""
+    if granularity == 'day':
+        return day
+    if granularity == 'week':
+        return day - timedelta(days=day.weekday())
+    if granularity == 'month':
+        return day.replace(day=1)
+    if granularity == 'quarter':
+        return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+    raise ValueError(f"Unsupported granularity: {granularity}")
+
+
+def shift_bucket(day, granularity, steps):
+    if granularity == 'day':
+        return day + timedelta(days=steps)
+    if granularity == 'week':
+        return day + timedelta(weeks=steps)
+    if granularity == 'month':
+        return _shift_months(day, steps)
+    if granularity == 'quarter':
+        return _shift_months(day, steps * 3)
+    raise ValueError(f"Unsupported granularity: {granularity}")
+
+
+def bucket_label(day, granularity):
+    if granularity == 'month':
+        return day.strftime('%b %Y')
+    if granularity == 'quarter':
+        return f"Q{(day.month - 1) // 3 + 1} {day.year}"
+    return day.strftime('%d %b %Y')
+
+
+def bucket_starts(granularity, count, now=None):
+    """
+    Local start dates of the `count` most recent buckets, oldest first, ending
+    with the bucket that contains `now` (in the default `TIME_ZONE`).
+    """
+    tz = timezone.get_default_timezone()
+    today = timezone.localtime(now or timezone.now(), tz).date()
+    current = bucket_floor(today, granularity)
+    return [shift_bucket(current, granularity, -offset) for offset in range(count - 1, -1, -1)]
+
+
+def _local_midnight(day, tz):
+    return datetime.combine(day, time.min, tzinfo=tz)
+
+
+def _bucket_query(queryset, field, granularity, count, now):
+    tz = timezone.get_default_timezone()
+    starts = bucket_starts(granularity, count, now=now)
+    window_start = _local_midnight(starts[0], tz)
+    window_end = _local_midnight(shift_bucket(starts[-1], granularity, 1), tz)
+
+    rows = (
+        queryset.filter(**{f'{field}__gte': window_start, f'{field}__lt': window_end})
+        .annotate(bucket=Trunc(field, granularity, tzinfo=tz))
+        .values('bucket')
+        .annotate(count=Count('pk'))
+        .order_by('bucket')
+    )
+    return rows, starts
+
+
+def _fill_buckets(rows, starts, granularity):
+    tz = timezone.get_default_timezone()
+    counts = {timezone.localtime(row['bucket'], tz).date(): row['count'] for row in rows}
+
+    return [
+        {
+            'label': bucket_label(start, granularity),
+            'start': start.isoformat(),
+            'value': counts.get(start, 0),
+        }
+        for start in starts
+    ]
+
+
+def count_by_bucket(queryset, field, granularity, count, now=None):
+    """
+    Count rows of `queryset` per time bucket of `field` with a single grouped
+    query, returning zero-filled buckets oldest first.
+    """
+    rows, starts = _bucket_query(queryset, field, granularity, count, now)
+    return _fill_buckets(rows, starts, granularity)
+
+
+async def acount_by_bucket(queryset, field, granularity, count, now=None):
+    """Async `count_by_bucket`."""
+    rows, starts = _bucket_query(queryset, field, granularity, count, now)
+    return _fill_buckets([row async for row in rows], starts, granularity)
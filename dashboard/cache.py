@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.core.cache import cache
+
+STATS_VERSION_KEY = 'dashboard:stats:version'
+
+
+def _stats_scope(user) -> str:
+    if user.is_admin or user.is_staff:
+        return 'global'
+    return f'user:{user.pk}'
+
+
+def _stats_version() -> int:
+    version = cache.get(STATS_VERSION_KEY)
+    if version is None:
+        cache.add(STATS_VERSION_KEY, 1, timeout=None)
+        version = cache.get(STATS_VERSION_KEY, 1)
+    return version
+
+
+async def _astats_version() -> int:
+    version = await cache.aget(STATS_VERSION_KEY)
+    if version is None:
+        await cache.aadd(STATS_VERSION_KEY, 1, timeout=None)
+        version = await cache.aget(STATS_VERSION_KEY, 1)
+    return version
+
+
+def stats_cache_key(user, granularity: str, bucket_count: int) -> str:
+    return f'dashboard:stats:v{_stats_version()}:{_stats_scope(user)}:{granularity}:{bucket_count}'
+
+
+async def astats_cache_key(user, granularity: str, bucket_count: int) -> str:
+    return f'dashboard:stats:v{await _astats_version()}:{_stats_scope(user)}:{granularity}:{bucket_count}'
+
+
+def get_cached_stats(key: str):
+    return cache.get(key)
+
+
+def set_cached_stats(key: str, stats) -> None:
+    # Callers resolve the key before computing, so a payload computed while an
+    # invalidation landed is stored under the superseded version and never read.
+    cache.set(key, stats, timeout=settings.DASHBOARD_STATS_CACHE_TTL)
+
+
+async def aget_cached_stats(key: str):
+    return await cache.aget(key)
+
+
+async def aset_cached_stats(key: str, stats) -> None:
+    await cache.aset(key, stats, timeout=settings.DASHBOARD_STATS_CACHE_TTL)
+
+
+def invalidate_stats() -> None:
+    """
+    Bump the shared version so every scope's cached payload is ignored. A single
+    event change can move counts in the global scope and for both the old and
+    new owner, so versioning is simpler than tracking affected keys.
+    """
+    try:
+        cache.incr(STATS_VERSION_KEY)
+    except ValueError:
+        cache.set(STATS_VERSION_KEY, 2, timeout=None)
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from events.models import Event
+from events.signals import events_bulk_created
+
+from .cache import invalidate_stats
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_dashboard_stats(sender, **kwargs):
+    invalidate_stats()
+
+
+@receiver(events_bulk_created, sender=Event)
+def invalidate_dashboard_stats_after_bulk_create(sender, **kwargs):
+    invalidate_stats()
@@ -1,3 +1,126 @@
-from django.test import TestCase
+import json
+from datetime import date, datetime, timedelta, timezone as dt_timezone
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import AsyncRequestFactory, SimpleTestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from events.models import Event
+
+from .async_views import AsyncDashboardStatsView
+from .buckets import bucket_starts
+
+User = get_user_model()
+
+
+class DashboardStatsViewTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(username='boss@example.com', email='boss@example.com', password='pass12345', is_admin=True)
+        self.member = User.objects.create_user(username='member@example.com', email='member@example.com', password='pass12345')
+        now = timezone.now()
+        for index, owner in enumerate([self.admin, self.member] * 4, start=1):
+            Event.objects.create(title=f'Past {index}', event_date=now - timedelta(days=index), created_by=owner)
+        for index in range(1, 3):
+            Event.objects.create(title=f'Upcoming {index}', event_date=now + timedelta(days=index), created_by=self.admin)
+
+    def test_stats_use_a_fixed_number_of_queries(self):
+        self.client.force_authenticate(self.admin)
+
+        # summary aggregate + monthly breakdown + recent events
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('dashboard-stats'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['summary']['total_events'], 10)
+        self.assertEqual(response.data['summary']['upcoming_events'], 2)
+        self.assertEqual(len(response.data['recent_events']), 5)
+        self.assertEqual(len(response.data['monthly_breakdown']), 6)
+
+    def test_members_only_see_their_own_events(self):
+        self.client.force_authenticate(self.member)
+
+        response = self.client.get(reverse('dashboard-stats'))
+
+        self.assertEqual(response.data['summary']['total_events'], 4)
+        self.assertEqual(sum(bucket['value'] for bucket in response.data['monthly_breakdown']), 4)
+
+    def test_stats_are_served_from_cache_until_an_event_changes(self):
+        self.client.force_authenticate(self.admin)
+        self.client.get(reverse('dashboard-stats'))
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(reverse('dashboard-stats'))
+        self.assertEqual(cached.data['summary']['total_events'], 10)
+
+        Event.objects.create(title='Fresh', event_date=timezone.now(), created_by=self.member)
+        response = self.client.get(reverse('dashboard-stats'))
+
+        self.assertEqual(response.data['summary']['total_events'], 11)
+
+    def test_cache_scopes_are_per_user_for_members(self):
+        self.client.force_authenticate(self.admin)
+        self.client.get(reverse('dashboard-stats'))
+        self.client.force_authenticate(self.member)
+
+        response = self.client.get(reverse('dashboard-stats'))
+
+        self.assertEqual(response.data['summary']['total_events'], 4)
+
+    def test_granularity_and_range_parameters(self):
+        self.client.force_authenticate(self.member)
+
+        response = self.client.get(reverse('dashboard-stats'), {'granularity': 'day', 'range': 30})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['breakdown']['granularity'], 'day')
+        self.assertEqual(len(response.data['breakdown']['buckets']), 30)
+        self.assertEqual(sum(bucket['value'] for bucket in response.data['breakdown']['buckets']), 4)
+        self.assertNotIn('monthly_breakdown', response.data)
+
+    def test_invalid_granularity_is_rejected(self):
+        self.client.force_authenticate(self.member)
+
+        response = self.client.get(reverse('dashboard-stats'), {'granularity': 'fortnight'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_async_view_matches_sync_view(self):
+        headers = {'Authorization': f'Bearer {AccessToken.for_user(self.member)}'}
+        request = AsyncRequestFactory().get('/api/dashboard/stats/', {'granularity': 'week'}, headers=headers)
+        expected = await self.async_client.get(reverse('dashboard-stats'), {'granularity': 'week'}, headers=headers)
+        await cache.aclear()
+
+        response = await AsyncDashboardStatsView.as_view()(request)
+        cached = await AsyncDashboardStatsView.as_view()(request)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content), expected.json())
+        self.assertEqual(json.loads(response.content)['summary']['total_events'], 4)
+        self.assertEqual(cached.content, response.content)
+
+    async def test_async_view_requires_authentication(self):
+        response = await AsyncDashboardStatsView.as_view()(AsyncRequestFactory().get('/api/dashboard/stats/'))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn('WWW-Authenticate', response)
+
+
+class BucketStartsTests(SimpleTestCase):
+    def test_months_are_calendar_correct_at_month_end(self):
+        now = datetime(2025, 3, 31, 12, tzinfo=dt_timezone.utc)
+
+        starts = bucket_starts('month', 6, now=now)
+
+        self.assertEqual(starts, [date(2024, 10, 1), date(2024, 11, 1), date(2024, 12, 1), date(2025, 1, 1), date(2025, 2, 1), date(2025, 3, 1)])
+
+    def test_weeks_and_quarters_align_to_their_boundaries(self):
+        now = datetime(2025, 5, 15, 12, tzinfo=dt_timezone.utc)
+
+        self.assertEqual(bucket_starts('week', 2, now=now), [date(2025, 5, 5), date(2025, 5, 12)])
+        self.assertEqual(bucket_starts('quarter', 3, now=now), [date(2024, 10, 1), date(2025, 1, 1), date(2025, 4, 1)])
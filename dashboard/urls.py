@@ -1,7 +1,11 @@
+from django.conf import settings
 from django.urls import path
 
 from .views import DashboardStatsView
 
+if settings.ASYNC_VIEWS:
+    from .async_views import AsyncDashboardStatsView as DashboardStatsView  # noqa: F811
+
 urlpatterns = [
     path('stats/', DashboardStatsView.as_view(), name='dashboard-stats'),
 ]
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Event
+from .models import CalendarFeedToken, Event, EventReminderLog, NotificationOutbox
 
 
 @admin.register(Event)
@@ -8,3 +8,24 @@ class EventAdmin(admin.ModelAdmin):
     list_display = ('title', 'event_date', 'created_by', 'created_at')
     search_fields = ('title', 'description', 'created_by__email')
     list_filter = ('event_date', 'created_at')
+
+
+@admin.register(NotificationOutbox)
+class NotificationOutboxAdmin(admin.ModelAdmin):
+    list_display = ('subject', 'status', 'attempts', 'sent_count', 'available_at', 'sent_at')
+    list_filter = ('status',)
+    search_fields = ('subject',)
+
+
+@admin.register(EventReminderLog)
+class EventReminderLogAdmin(admin.ModelAdmin):
+    list_display = ('event', 'offset_minutes', 'event_date', 'sent_at')
+    list_filter = ('offset_minutes',)
+    raw_id_fields = ('event', 'notification')
+
+
+@admin.register(CalendarFeedToken)
+class CalendarFeedTokenAdmin(admin.ModelAdmin):
+    list_display = ('user', 'created_at')
+    raw_id_fields = ('user',)
+    exclude = ('token',)
@@ -0,0 +1,68 @@
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.shortcuts import aget_object_or_404
+from django.utils.cache import get_conditional_response
+from rest_framework import permissions, status
+from rest_framework.response import Response
+
+from config.async_views import AsyncAPIView
+from config.conditional import apply_validators, conditional_validators, page_version
+
+from .filters import EventFilterBackend
+from .models import Event
+from .notifications import queue_event_created_notification, queue_event_manual_reminder
+from .pagination import EventCursorPagination
+from .serializers import EventSerializer
+from .views import EventQuerysetMixin, EventReminderView
+
+
+class AsyncEventListCreateView(EventQuerysetMixin, AsyncAPIView):
+    """Async `EventListCreateView`: same filters, cursor pages and validators."""
+
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+
+    async def get(self, request):
+        queryset = EventFilterBackend().filter_queryset(request, self.get_queryset(), self)
+        # CursorPagination has no async API; the page query runs in one hop on
+        # the same thread the async ORM would use.
+        paginator = EventCursorPagination()
+        page = await sync_to_async(paginator.paginate_queryset)(queryset, request, view=self)
+        etag, timestamp = conditional_validators(request, page_version(page, 'updated_at', paginator), None)
+        not_modified = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if not_modified is not None:
+            return apply_validators(not_modified, etag, timestamp)
+
+        data = EventSerializer(page, many=True, context={'request': request}).data
+        return apply_validators(paginator.get_paginated_response(data), etag, timestamp)
+
+    async def post(self, request):
+        serializer = EventSerializer(data=request.data, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        await sync_to_async(self._create)(serializer, request.user)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @staticmethod
+    def _create(serializer, user):
+        with transaction.atomic():
+            event = serializer.save(created_by=user)
+            queue_event_created_notification(event)
+
+
+class AsyncEventReminderView(AsyncAPIView):
+    """
+    Async `EventReminderView`. Delivery already happens in the outbox worker,
+    so the request only waits for the event lookup and the outbox insert.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    async def post(self, request, pk):
+        event = await aget_object_or_404(Event.objects.select_related('created_by'), pk=pk)
+        if not EventReminderView._user_can_manage(event, request.user):
+            return Response({'detail': 'Not authorized to send reminders for this event.'}, status=status.HTTP_403_FORBIDDEN)
+
+        await sync_to_async(queue_event_manual_reminder)(event, triggered_by=request.user)
+        return Response(
+            {'detail': 'Reminder queued for delivery.'},
+            status=status.HTTP_202_ACCEPTED,
+        )
@@ -0,0 +1,91 @@
+import csv
+import io
+import json
+from itertools import islice
+from typing import Iterable, Iterator
+
+from django.conf import settings
+from django.db import transaction
+
+from .models import Event
+from .notifications import queue_event_digest_notification
+from .serializers import EventSerializer
+from .signals import events_bulk_created
+
+EXPORT_FIELDS = (
+    'id',
+    'title',
+    'description',
+    'event_date',
+    'created_by',
+    'created_by__email',
+    'created_at',
+    'updated_at',
+)
+EXPORT_COLUMNS = tuple(field.replace('created_by__email', 'created_by_email') for field in EXPORT_FIELDS)
+MAX_REPORTED_ERRORS = 100
+
+
+def import_events(rows: Iterable[dict], created_by) -> tuple[int, list[dict]]:
+    """
+    Validate `rows` with `EventSerializer` and insert them with `bulk_create` in
+    chunks of `EVENT_IMPORT_CHUNK_SIZE`, all inside one transaction. Any invalid
+    row rolls the whole import back. Returns (created, errors); a successful
+    import queues a single digest notification instead of one per event.
+    """
+    chunk_size = settings.EVENT_IMPORT_CHUNK_SIZE
+    created = 0
+    errors = []
+    recent = []
+    numbered_rows = enumerate(rows, start=1)
+
+    with transaction.atomic():
+        while chunk := list(islice(numbered_rows, chunk_size)):
+            pending = []
+            for row_number, row in chunk:
+                serializer = EventSerializer(data=row)
+                if serializer.is_valid():
+                    pending.append(Event(created_by=created_by, **serializer.validated_data))
+                elif len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append({'row': row_number, 'errors': serializer.errors})
+            if errors:
+                # Keep validating so the client gets every error in one pass.
+                continue
+            Event.objects.bulk_create(pending)
+            created += len(pending)
+            recent = (recent + pending)[-settings.EVENT_IMPORT_DIGEST_SIZE:]
+
+        if errors:
+            transaction.set_rollback(True)
+            return 0, errors
+        if created:
+            queue_event_digest_notification(recent, created, created_by)
+            transaction.on_commit(lambda: events_bulk_created.send(sender=Event, count=created))
+    return created, []
+
+
+def _export_rows(queryset) -> Iterator[dict]:
+    for row in queryset.values(*EXPORT_FIELDS).iterator(chunk_size=settings.EVENT_EXPORT_CHUNK_SIZE):
+        row['created_by_email'] = row.pop('created_by__email')
+        for field in ('event_date', 'created_at', 'updated_at'):
+            row[field] = row[field].isoformat()
+        yield row
+
+
+def stream_csv(queryset) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    for row in _export_rows(queryset):
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def stream_jsonl(queryset) -> Iterator[str]:
+    for row in _export_rows(queryset):
+        yield json.dumps(row) + '\n'
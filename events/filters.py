@@ -0,0 +1,59 @@
+from datetime import datetime, time
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework import serializers
+from rest_framework.filters import BaseFilterBackend
+
+from .search import filter_events
+
+
+class DateOrDateTimeField(serializers.DateTimeField):
+    """Accept either an ISO datetime or a bare date, read as local midnight."""
+
+    def to_internal_value(self, value):
+        if isinstance(value, str) and len(value) == 10:
+            day = parse_date(value)
+            if day is not None:
+                return timezone.make_aware(datetime.combine(day, time.min))
+        return super().to_internal_value(value)
+
+
+class EventFilterSerializer(serializers.Serializer):
+    start = DateOrDateTimeField(required=False)
+    end = DateOrDateTimeField(required=False)
+    created_by = serializers.IntegerField(required=False, min_value=1)
+    upcoming = serializers.BooleanField(required=False, default=False)
+    search = serializers.CharField(required=False, max_length=255)
+
+    def validate(self, attrs):
+        start, end = attrs.get('start'), attrs.get('end')
+        if start and end and start >= end:
+            raise serializers.ValidationError({'end': 'Must be later than start.'})
+        return attrs
+
+
+class EventFilterBackend(BaseFilterBackend):
+    """
+    Query-string filters for event lists. `start` is inclusive and `end`
+    exclusive; both bound `event_date` so they use the `event_date` indexes,
+    `created_by` narrows onto the `(created_by, event_date)` index, and
+    `search` is a full-text match served by the `events.search` index.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        params = EventFilterSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        filters = params.validated_data
+
+        if 'start' in filters:
+            queryset = queryset.filter(event_date__gte=filters['start'])
+        if 'end' in filters:
+            queryset = queryset.filter(event_date__lt=filters['end'])
+        if filters['upcoming']:
+            queryset = queryset.filter(event_date__gte=timezone.now())
+        if 'created_by' in filters:
+            queryset = queryset.filter(created_by_id=filters['created_by'])
+        if filters.get('search'):
+            queryset = filter_events(queryset, filters['search'])
+        return queryset
@@ -0,0 +1,67 @@
+import importlib.util
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import AccessToken
+
+from config.load import format_summary, free_port, run_load, spawn_server
+from config.seeding import cleanup_data, seed_data
+
+PATHS = (
+    '/api/events/?page_size=50',
+    '/api/dashboard/stats/',
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare concurrent-request throughput of the sync views under gunicorn sync workers "
+        "with the async views (ASYNC_VIEWS) under uvicorn, with the same number of worker processes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=2)
+        parser.add_argument('--concurrency', type=int, default=32)
+        parser.add_argument('--requests', type=int, default=1000, help="Requests per path per server.")
+        parser.add_argument('--events', type=int, default=5000)
+        parser.add_argument('--keep', action='store_true', help="Leave the seeded rows in place.")
+
+    def handle(self, *args, **options):
+        if settings.DATABASES['default']['NAME'] == ':memory:':
+            raise CommandError("The servers need a shared database; in-memory SQLite will not work.")
+
+        servers = [('gunicorn sync (WSGI)', self._gunicorn_command, {'ASYNC_VIEWS': 'false'})]
+        if importlib.util.find_spec('uvicorn') is None:
+            self.stdout.write("uvicorn not installed; skipping the ASGI run.")
+        else:
+            servers.append(('uvicorn async (ASGI)', self._uvicorn_command, {'ASYNC_VIEWS': 'true'}))
+
+        self.stdout.write(f"Seeding {options['events']} events...")
+        users = seed_data(users=10, events=options['events'], feedback=0, contacts=0).users
+        headers = {'Authorization': f'Bearer {AccessToken.for_user(users[0])}'}
+        try:
+            for name, build_command, env in servers:
+                port = free_port()
+                with spawn_server(build_command(port, options['workers']), port, env):
+                    self.stdout.write(self.style.SUCCESS(f"{name}, {options['workers']} workers, {options['concurrency']} concurrent clients"))
+                    for path in PATHS:
+                        result = run_load(
+                            path, port, lambda _, path=path: ('GET', path, headers, None),
+                            options['requests'], options['concurrency'],
+                        )
+                        self.stdout.write(format_summary(result.summary(), width=28))
+        finally:
+            if not options['keep']:
+                cleanup_data()
+
+    @staticmethod
+    def _gunicorn_command(port, workers):
+        return [sys.executable, '-m', 'gunicorn', 'config.wsgi', '--workers', str(workers), '--bind', f'127.0.0.1:{port}']
+
+    @staticmethod
+    def _uvicorn_command(port, workers):
+        return [
+            sys.executable, '-m', 'uvicorn', 'config.asgi:application',
+            '--workers', str(workers), '--port', str(port), '--log-level', 'warning',
+        ]
@@ -0,0 +1,99 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from config.load import time_call
+from config.seeding import cleanup_data, seed_data
+from events.models import Event
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a synthetic event dataset and report EXPLAIN plans and timings for the "
+        "list, dashboard and upcoming-event queries with and without the Event indexes. "
+        "The indexes are dropped and re-created, so it refuses to run unless the default "
+        "database is a test database or --disposable-db is passed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=200)
+        parser.add_argument('--events', type=int, default=100000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--keep', action='store_true', help="Leave the seeded rows in place.")
+        parser.add_argument(
+            '--disposable-db', action='store_true',
+            help="Confirm the default database is a throwaway copy that may lose its Event indexes.",
+        )
+
+    def handle(self, *args, **options):
+        if not options['disposable_db'] and not self._is_test_database():
+            raise CommandError(
+                f"Refusing to drop indexes on {connection.settings_dict['NAME']}. Point DATABASE_URL at a "
+                "throwaway database and pass --disposable-db."
+            )
+        self.stdout.write(f"Seeding {options['events']} events for {options['users']} users...")
+        try:
+            users = seed_data(users=options['users'], events=options['events'], feedback=0, contacts=0, span_days=730).users
+            owner = users[0]
+            scenarios = self._scenarios(owner)
+            indexes = Event._meta.indexes
+
+            with connection.schema_editor() as editor:
+                for index in indexes:
+                    editor.remove_index(Event, index)
+            try:
+                self._run_phase('without indexes', scenarios, options['repeat'])
+            finally:
+                with connection.schema_editor() as editor:
+                    for index in indexes:
+                        editor.add_index(Event, index)
+
+            self._run_phase('with indexes', scenarios, options['repeat'])
+        finally:
+            if not options['keep']:
+                cleanup_data()
+
+    @staticmethod
+    def _is_test_database():
+        if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+            return True
+        return str(connection.settings_dict['NAME']).startswith('test_')
+
+    @staticmethod
+    def _scenarios(owner):
+        now = timezone.now()
+        owned = Event.objects.filter(created_by=owner)
+        return [
+            (
+                'event list (first page)',
+                Event.objects.select_related('created_by').filter(event_date__gte=now).order_by('event_date', 'id')[:50],
+                lambda queryset: list(queryset),
+            ),
+            (
+                'dashboard summary (member scope)',
+                owned.order_by(),
+                lambda queryset: queryset.aggregate(
+                    total=Count('id'),
+                    upcoming=Count('id', filter=Q(event_date__gte=now)),
+                ),
+            ),
+            (
+                'upcoming events (member scope)',
+                owned.filter(event_date__gte=now).order_by('event_date')[:5],
+                lambda queryset: list(queryset),
+            ),
+        ]
+
+    def _run_phase(self, label, scenarios, repeat):
+        if connection.vendor == 'sqlite':
+            connection.cursor().execute('ANALYZE')
+        self.stdout.write(self.style.MIGRATE_HEADING(f"\n== {label} =="))
+        for name, queryset, runner in scenarios:
+            timing = time_call(lambda: runner(queryset.all()), repeat=repeat)
+            self.stdout.write(self.style.SUCCESS(name))
+            self.stdout.write(
+                f"  median {timing['median_ms']:.2f} ms (min {timing['min_ms']:.2f}, max {timing['max_ms']:.2f})"
+            )
+            for line in queryset.explain().splitlines():
+                self.stdout.write(f"  | {line}")
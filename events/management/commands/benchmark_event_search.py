@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from config.load import time_call
+from config.seeding import cleanup_data, seed_data
+from events.models import Event
+from events.search import search_backend, search_event_ids
+
+DEFAULT_TERMS = ('ref42', 'ref4242 roadmap', 'roadmap')
+
+
+class Command(BaseCommand):
+    help = "Compare the full-text event search index against icontains scans on a synthetic dataset."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100)
+        parser.add_argument('--events', type=int, default=100000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--limit', type=int, default=20)
+        parser.add_argument('--term', action='append', dest='terms', help="Search term to time (repeatable).")
+        parser.add_argument('--keep', action='store_true', help="Leave the seeded rows in place.")
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Seeding {options['events']} events for {options['users']} users...")
+        seed_data(users=options['users'], events=options['events'], feedback=0, contacts=0, span_days=730)
+        try:
+            self.stdout.write(f"Search backend: {search_backend()}")
+            for term in options['terms'] or DEFAULT_TERMS:
+                indexed = time_call(lambda: search_event_ids(term, limit=options['limit']), repeat=options['repeat'])
+                scan = time_call(lambda: self._icontains(term, options['limit']), repeat=options['repeat'])
+                self.stdout.write(self.style.SUCCESS(f"'{term}'"))
+                self.stdout.write(f"  full-text  median {indexed['median_ms']:.2f} ms (min {indexed['min_ms']:.2f})")
+                self.stdout.write(f"  icontains  median {scan['median_ms']:.2f} ms (min {scan['min_ms']:.2f})")
+        finally:
+            if not options['keep']:
+                cleanup_data()
+
+    @staticmethod
+    def _icontains(term, limit):
+        query = Q()
+        for word in term.split():
+            query &= Q(title__icontains=word) | Q(description__icontains=word)
+        return list(Event.objects.filter(query).values_list('id', flat=True)[:limit])
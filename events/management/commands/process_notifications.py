@@ -0,0 +1,40 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from events.notifications import process_outbox
+
+
+class Command(BaseCommand):
+    help = "Drain the notification outbox, delivering queued event emails."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="Process the currently due notifications and exit.")
+        parser.add_argument('--batch-size', type=int, default=None, help="Maximum notifications handled per pass.")
+        parser.add_argument('--interval', type=float, default=None, help="Seconds to sleep when the outbox is empty.")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size'] or settings.NOTIFICATION_OUTBOX_BATCH_SIZE
+        interval = options['interval'] if options['interval'] is not None else settings.NOTIFICATION_OUTBOX_POLL_INTERVAL
+
+        if options['once']:
+            total = 0
+            while True:
+                processed = process_outbox(limit=batch_size)
+                total += processed
+                if processed < batch_size:
+                    break
+            self.stdout.write(f"Processed {total} notification(s).")
+            return
+
+        self.stdout.write("Notification worker started.")
+        try:
+            while True:
+                processed = process_outbox(limit=batch_size)
+                if processed:
+                    self.stdout.write(f"Processed {processed} notification(s).")
+                if processed < batch_size:
+                    time.sleep(interval)
+        except KeyboardInterrupt:
+            self.stdout.write("Notification worker stopped.")
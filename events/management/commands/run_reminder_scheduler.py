@@ -0,0 +1,37 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from events.reminders import ReminderScheduler
+
+
+class Command(BaseCommand):
+    help = "Queue automatic event reminders at EVENT_REMINDER_OFFSETS minutes before each event."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="Queue the reminders that are currently due and exit.")
+        parser.add_argument('--interval', type=float, default=None, help="Maximum seconds to sleep between ticks.")
+
+    def handle(self, *args, **options):
+        interval = options['interval'] if options['interval'] is not None else settings.EVENT_REMINDER_POLL_INTERVAL
+        scheduler = ReminderScheduler()
+
+        if options['once']:
+            self.stdout.write(f"Queued {scheduler.tick()} reminder(s).")
+            return
+
+        self.stdout.write("Reminder scheduler started.")
+        try:
+            while True:
+                sent = scheduler.tick()
+                if sent:
+                    self.stdout.write(f"Queued {sent} reminder(s).")
+                # Wake for the next due reminder, but still poll for new or
+                # rescheduled events at least every `interval` seconds.
+                next_due = scheduler.next_due()
+                delay = interval if next_due is None else (next_due - timezone.now()).total_seconds()
+                time.sleep(min(interval, max(delay, 0.1)))
+        except KeyboardInterrupt:
+            self.stdout.write("Reminder scheduler stopped.")
@@ -0,0 +1,57 @@
+from django.db import migrations
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE events_event_fts USING fts5("
+    "title, description, content='events_event', content_rowid='id')",
+    "CREATE TRIGGER events_event_fts_ai AFTER INSERT ON events_event BEGIN "
+    "INSERT INTO events_event_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER events_event_fts_ad AFTER DELETE ON events_event BEGIN "
+    "INSERT INTO events_event_fts(events_event_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER events_event_fts_au AFTER UPDATE OF title, description ON events_event BEGIN "
+    "INSERT INTO events_event_fts(events_event_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO events_event_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "INSERT INTO events_event_fts(events_event_fts) VALUES ('rebuild')",
+]
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS events_event_fts_au",
+    "DROP TRIGGER IF EXISTS events_event_fts_ad",
+    "DROP TRIGGER IF EXISTS events_event_fts_ai",
+    "DROP TABLE IF EXISTS events_event_fts",
+]
+POSTGRES_FORWARD = [
+    "CREATE INDEX IF NOT EXISTS events_event_search_idx ON events_event USING GIN "
+    "(to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, '')))",
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS events_event_search_idx",
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        if vendor == 'sqlite':
+            with schema_editor.connection.cursor() as cursor:
+                cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+                if not cursor.fetchone()[0]:
+                    # Without FTS5 search falls back to icontains matching.
+                    return
+        for statement in statements_by_vendor.get(vendor, []):
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_event_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRES_FORWARD}),
+            _run({'sqlite': SQLITE_BACKWARD, 'postgresql': POSTGRES_BACKWARD}),
+        ),
+    ]
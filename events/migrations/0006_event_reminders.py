@@ -0,0 +1,46 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_event_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventReminderLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('offset_minutes', models.PositiveIntegerField()),
+                ('event_date', models.DateTimeField()),
+                ('sent_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-sent_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['updated_at'], name='events_updated_at_idx'),
+        ),
+        migrations.AddField(
+            model_name='eventreminderlog',
+            name='event',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reminder_logs', to='events.event'),
+        ),
+        migrations.AddField(
+            model_name='eventreminderlog',
+            name='notification',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='events.notificationoutbox'),
+        ),
+        migrations.AddConstraint(
+            model_name='eventreminderlog',
+            constraint=models.UniqueConstraint(fields=('event', 'offset_minutes', 'event_date'), name='events_reminder_once'),
+        ),
+    ]
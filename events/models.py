@@ -1,5 +1,8 @@
+import secrets
+
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class Event(models.Model):
@@ -16,6 +19,103 @@ class Event(models.Model):
 
     class Meta:
         ordering = ['event_date']
+        indexes = [
+            models.Index(fields=['created_by', 'event_date'], name='events_creator_date_idx'),
+            models.Index(fields=['event_date'], name='events_event_date_idx'),
+            models.Index(fields=['updated_at'], name='events_updated_at_idx'),
+        ]
 
     def __str__(self) -> str:
         return self.title
+
+
+class NotificationOutbox(models.Model):
+    """
+    Pending outbound email written alongside the change that triggered it and
+    drained asynchronously by the `process_notifications` management command.
+    """
+
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = (
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_SENT, 'Sent'),
+        (STATUS_FAILED, 'Failed'),
+    )
+
+    event = models.ForeignKey(
+        Event,
+        related_name='notifications',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
+    subject = models.CharField(max_length=512)
+    message = models.TextField()
+    exclude = models.JSONField(default=list, blank=True)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    sent_count = models.PositiveIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['available_at', 'id']
+        indexes = [
+            models.Index(fields=['status', 'available_at'], name='events_outbox_due_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.subject} ({self.status})"
+
+
+class EventReminderLog(models.Model):
+    """
+    One row per automatic reminder sent, written in the same transaction as its
+    outbox row. The unique constraint keeps the `run_reminder_scheduler` worker
+    from sending a reminder twice, across restarts and concurrent workers; a
+    rescheduled event gets fresh reminders because `event_date` is part of it.
+    """
+
+    event = models.ForeignKey(Event, related_name='reminder_logs', on_delete=models.CASCADE)
+    offset_minutes = models.PositiveIntegerField()
+    event_date = models.DateTimeField()
+    notification = models.ForeignKey(
+        NotificationOutbox,
+        related_name='+',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
+    sent_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-sent_at']
+        constraints = [
+            models.UniqueConstraint(fields=['event', 'offset_minutes', 'event_date'], name='events_reminder_once'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.event_id} -{self.offset_minutes}m"
+
+
+def generate_feed_token() -> str:
+    return secrets.token_urlsafe(32)
+
+
+class CalendarFeedToken(models.Model):
+    """
+    Secret naming a user's subscribable `.ics` feed. Calendar clients cannot
+    send credentials, so the unguessable token is the credential: rotating or
+    deleting it cuts off every existing subscription.
+    """
+
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, related_name='calendar_feed_token', on_delete=models.CASCADE)
+    token = models.CharField(max_length=64, unique=True, default=generate_feed_token)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"Feed token for user {self.user_id}"
@@ -1,34 +1,69 @@
 import logging
-from typing import Iterable, Optional
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, Optional
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection
+from django.db import connection, transaction
+from django.db.models.functions import Lower
 from django.utils import timezone
 
-from .models import Event
+from .models import Event, NotificationOutbox
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+SMTP_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+
+
+class NotificationDeliveryError(Exception):
+    """Raised when no recipient of a notification could be reached."""
+
+
+@dataclass
+class DispatchReport:
+    sent: int = 0
+    failed: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    errors: list[str] = field(default_factory=list)
+
 
 def _get_sender_email() -> Optional[str]:
-    host_user = getattr(settings, 'EMAIL_HOST_USER', '')
-    host_password = getattr(settings, 'EMAIL_HOST_PASSWORD', '')
-    from_email = getattr(settings, 'DEFAULT_FROM_EMAIL', host_user)
-    if not (host_user and host_password and from_email):
-        logger.info("Email not configured; skipping notification dispatch.")
+    from_email = getattr(settings, 'DEFAULT_FROM_EMAIL', '')
+    backend = getattr(settings, 'EMAIL_BACKEND', SMTP_BACKEND)
+    if backend == SMTP_BACKEND:
+        host_user = getattr(settings, 'EMAIL_HOST_USER', '')
+        host_password = getattr(settings, 'EMAIL_HOST_PASSWORD', '')
+        from_email = from_email or host_user
+        if not (host_user and host_password):
+            from_email = None
+    if not from_email:
+        logger.warning("Email not configured; notification dispatch deferred.")
         return None
     return from_email
 
 
-def _get_recipients(exclude: Optional[Iterable[str]] = None) -> list[str]:
-    exclusion_set = set(email.lower() for email in exclude or [] if email)
-    recipients = [
-        email for email in User.objects.exclude(email='').values_list('email', flat=True)
-        if email.lower() not in exclusion_set
-    ]
-    return recipients
+def _iter_recipients(exclude: Optional[Iterable[str]] = None, chunk_size: Optional[int] = None) -> Iterator[list[str]]:
+    """
+    Yield recipient emails in id-ordered chunks using keyset pagination, with
+    exclusions applied in SQL so memory stays bounded by one chunk.
+    """
+    chunk_size = chunk_size or getattr(settings, 'NOTIFICATION_BATCH_SIZE', 100)
+    exclusions = sorted(set(email.lower() for email in exclude or [] if email))
+    queryset = User.objects.exclude(email='')
+    if exclusions:
+        queryset = queryset.annotate(email_lower=Lower('email')).exclude(email_lower__in=exclusions)
+
+    last_id = 0
+    while True:
+        rows = list(queryset.filter(pk__gt=last_id).order_by('pk').values_list('pk', 'email')[:chunk_size])
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        yield [email for _, email in rows]
 
 
 def _format_event_datetime(event: Event) -> str:
@@ -39,30 +74,70 @@ def _format_event_datetime(event: Event) -> str:
     return event_dt.strftime('%A, %d %B %Y at %H:%M %Z')
 
 
-def _dispatch_event_email(subject: str, message: str, exclude: Optional[Iterable[str]] = None) -> int:
+def _send_bulk(subject: str, message: str, sender: str, batches: Iterable[list[str]]) -> DispatchReport:
+    """
+    Send one message per recipient over a single reused connection, a batch at
+    a time. A failing batch is recorded and skipped so the remaining batches
+    still go out.
+    """
+    report = DispatchReport()
+    mail_connection = get_connection(fail_silently=False)
+    with mail_connection:
+        for batch in batches:
+            report.batches += 1
+            messages = [
+                EmailMessage(subject=subject, body=message, from_email=sender, to=[recipient], connection=mail_connection)
+                for recipient in batch
+            ]
+            try:
+                sent = mail_connection.send_messages(messages) or 0
+            except Exception as exc:
+                report.failed += len(batch)
+                report.failed_batches += 1
+                report.errors.append(str(exc))
+                logger.warning("Notification batch %s failed (%s recipients): %s", report.batches, len(batch), exc)
+                # A failed SMTP exchange can leave the connection unusable; start fresh.
+                try:
+                    mail_connection.close()
+                    mail_connection.open()
+                except Exception:  # pragma: no cover - next batch will surface the error
+                    pass
+                continue
+            report.sent += sent
+            report.failed += len(batch) - sent
+
+    logger.info(
+        "Notification dispatch finished: %s sent, %s failed across %s batches (%s failed).",
+        report.sent, report.failed, report.batches, report.failed_batches,
+    )
+    return report
+
+
+def _dispatch_event_email(subject: str, message: str, exclude: Optional[Iterable[str]] = None) -> DispatchReport:
     sender = _get_sender_email()
     if not sender:
-        return 0
+        # Keep the outbox row for retry rather than recording it as sent.
+        raise NotificationDeliveryError("Email is not configured.")
 
-    recipients = _get_recipients(exclude=exclude)
-    if not recipients:
+    report = _send_bulk(subject, message, sender, _iter_recipients(exclude=exclude))
+    if not report.batches:
         logger.info("No recipients available for event notification.")
-        return 0
+    if report.failed and not report.sent:
+        # Nothing got through; let the outbox worker retry the whole notification.
+        raise NotificationDeliveryError(report.errors[-1] if report.errors else "No messages were delivered.")
+    return report
 
-    try:
-        return send_mail(
-            subject=subject,
-            message=message,
-            from_email=sender,
-            recipient_list=recipients,
-            fail_silently=False,
-        )
-    except Exception as exc:  # pragma: no cover - best effort notification
-        logger.warning("Failed to send event notification: %s", exc)
-        return 0
 
+def _queue_notification(event: Optional[Event], subject: str, message: str, exclude: Optional[Iterable[str]] = None) -> NotificationOutbox:
+    return NotificationOutbox.objects.create(
+        event=event,
+        subject=subject,
+        message=message,
+        exclude=[email for email in exclude or [] if email],
+    )
 
-def send_event_created_notification(event: Event) -> int:
+
+def queue_event_created_notification(event: Event) -> NotificationOutbox:
     event_dt = _format_event_datetime(event)
     creator_name = event.created_by.get_full_name() or event.created_by.email
     subject = f"New event scheduled: {event.title}"
@@ -73,10 +148,10 @@ def send_event_created_notification(event: Event) -> int:
         f"Description: {event.description or 'No description provided.'}\n\n"
         "Log in to PlanSync for more details."
     )
-    return _dispatch_event_email(subject, message, exclude=[event.created_by.email])
+    return _queue_notification(event, subject, message, exclude=[event.created_by.email])
 
 
-def send_event_manual_reminder(event: Event, triggered_by) -> int:
+def queue_event_manual_reminder(event: Event, triggered_by) -> NotificationOutbox:
     event_dt = _format_event_datetime(event)
     trigger_name = triggered_by.get_full_name() or triggered_by.email
     subject = f"Reminder: {event.title} on {event_dt}"
@@ -88,6 +163,99 @@ def send_event_manual_reminder(event: Event, triggered_by) -> int:
         "Please confirm your availability in PlanSync."
     )
     # Do not exclude the trigger—they likely expect the reminder too.
-    return _dispatch_event_email(subject, message)
+    return _queue_notification(event, subject, message)
+
+
+def _format_offset(minutes: int) -> str:
+    days, remainder = divmod(minutes, 1440)
+    hours, minutes = divmod(remainder, 60)
+    parts = [(days, 'day'), (hours, 'hour'), (minutes, 'minute')]
+    return ' '.join(f"{value} {unit}{'s' if value != 1 else ''}" for value, unit in parts if value) or 'now'
+
+
+def queue_event_scheduled_reminder(event: Event, now: Optional[datetime] = None) -> NotificationOutbox:
+    event_dt = _format_event_datetime(event)
+    # The time actually left, not the configured offset: the reminder may fire late.
+    minutes_left = max(1, round((event.event_date - (now or timezone.now())).total_seconds() / 60))
+    subject = f"Reminder: {event.title} starts in {_format_offset(minutes_left)}"
+    message = (
+        "This is a reminder for an upcoming event.\n\n"
+        f"Title: {event.title}\n"
+        f"When: {event_dt}\n"
+        f"Description: {event.description or 'No description provided.'}\n\n"
+        "Please confirm your availability in PlanSync."
+    )
+    return _queue_notification(event, subject, message)
+
+
+def queue_event_digest_notification(events: list[Event], total: int, created_by) -> NotificationOutbox:
+    creator_name = created_by.get_full_name() or created_by.email
+    listed = '\n'.join(f"- {event.title} ({_format_event_datetime(event)})" for event in events)
+    more = total - len(events)
+    subject = f"{total} new events scheduled"
+    message = (
+        f"{creator_name} imported {total} new events.\n\n"
+        f"{listed}\n"
+        + (f"...and {more} more.\n" if more > 0 else '')
+        + "\nLog in to PlanSync for more details."
+    )
+    return _queue_notification(None, subject, message, exclude=[created_by.email])
+
+
+def _claim_next_notification() -> Optional[NotificationOutbox]:
+    queryset = NotificationOutbox.objects.filter(
+        status=NotificationOutbox.STATUS_PENDING,
+        available_at__lte=timezone.now(),
+    ).order_by('available_at', 'id')
+    if connection.features.has_select_for_update_skip_locked:
+        queryset = queryset.select_for_update(skip_locked=True)
+    return queryset.first()
+
+
+def deliver_notification(notification: NotificationOutbox) -> bool:
+    """
+    Attempt delivery of a single outbox row and record the outcome on it.
+    Returns True when the row reached a terminal state.
+    """
+    notification.attempts += 1
+    try:
+        report = _dispatch_event_email(
+            notification.subject,
+            notification.message,
+            exclude=notification.exclude,
+        )
+    except Exception as exc:
+        notification.last_error = str(exc)
+        max_attempts = getattr(settings, 'NOTIFICATION_OUTBOX_MAX_ATTEMPTS', 5)
+        if notification.attempts >= max_attempts:
+            notification.status = NotificationOutbox.STATUS_FAILED
+            logger.error("Giving up on notification %s after %s attempts: %s", notification.pk, notification.attempts, exc)
+        else:
+            backoff = getattr(settings, 'NOTIFICATION_OUTBOX_RETRY_BACKOFF', 60)
+            notification.available_at = timezone.now() + timedelta(seconds=backoff * 2 ** (notification.attempts - 1))
+            logger.warning("Failed to send notification %s (attempt %s): %s", notification.pk, notification.attempts, exc)
+    else:
+        notification.status = NotificationOutbox.STATUS_SENT
+        notification.sent_at = timezone.now()
+        notification.sent_count = report.sent
+        notification.last_error = (
+            f"{report.failed} recipient(s) in {report.failed_batches} batch(es) failed: {report.errors[-1]}"
+            if report.failed_batches else ''
+        )
+
+    notification.save(update_fields=['attempts', 'status', 'sent_count', 'sent_at', 'available_at', 'last_error'])
+    return notification.status != NotificationOutbox.STATUS_PENDING
 
 
+def process_outbox(limit: Optional[int] = None) -> int:
+    """Deliver up to `limit` due notifications, one row per transaction."""
+    limit = limit or getattr(settings, 'NOTIFICATION_OUTBOX_BATCH_SIZE', 50)
+    processed = 0
+    while processed < limit:
+        with transaction.atomic():
+            notification = _claim_next_notification()
+            if notification is None:
+                break
+            deliver_notification(notification)
+        processed += 1
+    return processed
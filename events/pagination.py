@@ -0,0 +1,13 @@
+from rest_framework.pagination import CursorPagination
+
+
+class EventCursorPagination(CursorPagination):
+    """
+    Stable keyset pagination over `Event.Meta.ordering`, with `id` as the
+    tie-breaker so events sharing an `event_date` are never skipped or repeated.
+    """
+
+    ordering = ('event_date', 'id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
@@ -0,0 +1,60 @@
+import codecs
+import csv
+import json
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+from .ical import parse_vevents
+
+
+class StreamingRowsParser(BaseParser):
+    """
+    Base for bulk import parsers. `parse` returns a lazy iterator of row dicts
+    read straight off the request stream, so uploads are never held in memory.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get('encoding') or 'utf-8'
+        return self.iter_rows(codecs.getreader(encoding)(stream))
+
+    def iter_rows(self, lines):
+        raise NotImplementedError
+
+
+class CSVRowsParser(StreamingRowsParser):
+    media_type = 'text/csv'
+
+    def iter_rows(self, lines):
+        try:
+            yield from csv.DictReader(lines)
+        except csv.Error as exc:
+            raise ParseError(f"CSV parse error: {exc}")
+
+
+class JSONLinesRowsParser(StreamingRowsParser):
+    media_type = 'application/x-ndjson'
+
+    def iter_rows(self, lines):
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                raise ParseError(f"JSON parse error on line {line_number}: {exc}")
+
+
+class ICalendarRowsParser(StreamingRowsParser):
+    media_type = 'text/calendar'
+
+    def iter_rows(self, lines):
+        yield from parse_vevents(lines)
+
+
+PARSERS_BY_EXTENSION = {
+    '.csv': CSVRowsParser,
+    '.jsonl': JSONLinesRowsParser,
+    '.ndjson': JSONLinesRowsParser,
+    '.ics': ICalendarRowsParser,
+}
@@ -0,0 +1,141 @@
+"""
+Automatic event reminders.
+
+`ReminderScheduler` keeps a heap of reminders that fall due within the next
+`EVENT_REMINDER_HORIZON` seconds. The heap is filled by indexed `event_date`
+range queries, one per offset per tick, each covering only the slice of time
+not loaded yet, so a tick never rescans the table. Events created or
+rescheduled inside an already-loaded window are picked up from the
+`updated_at` index. Heap entries are checked against the current `event_date`
+when they fire, so stale ones are dropped rather than removed eagerly.
+
+Only the nearest reminder goes out when several are due together (an event
+created shortly before it starts, or one found after worker downtime): an
+offset is skipped when a smaller one falls due within
+`EVENT_REMINDER_GRACE` seconds, and subjects give the actual time left.
+"""
+import heapq
+import logging
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from .models import Event, EventReminderLog
+from .notifications import queue_event_scheduled_reminder
+
+logger = logging.getLogger(__name__)
+
+# Rows committed slightly after a tick can carry an `updated_at` from before
+# it; re-reading a short overlap keeps them from slipping through.
+CHANGE_OVERLAP = timedelta(minutes=1)
+
+
+class ReminderScheduler:
+    def __init__(
+        self,
+        offsets: Optional[Iterable[int]] = None,
+        horizon: Optional[int] = None,
+        now: Optional[datetime] = None,
+        grace: Optional[int] = None,
+    ):
+        now = now or timezone.now()
+        self.offsets = sorted(set(offsets if offsets is not None else settings.EVENT_REMINDER_OFFSETS))
+        self.horizon = timedelta(seconds=horizon if horizon is not None else settings.EVENT_REMINDER_HORIZON)
+        self.grace = timedelta(seconds=grace if grace is not None else settings.EVENT_REMINDER_GRACE)
+        self.queue: list[tuple[datetime, int, int, datetime]] = []
+        self.queued: set[tuple[int, int, datetime]] = set()
+        # Per offset, the `event_date` up to which events have been loaded.
+        # Starting at `now` means reminders missed while the worker was down
+        # still go out, as long as the event itself has not started.
+        self.loaded_until = {offset: now for offset in self.offsets}
+        self.changes_since = now
+
+    def tick(self, now: Optional[datetime] = None) -> int:
+        """Load newly due reminders, send those whose time has come, return how many were sent."""
+        now = now or timezone.now()
+        self._load_window(now)
+        self._load_changes(now)
+        return self._fire_due(now)
+
+    def next_due(self) -> Optional[datetime]:
+        return self.queue[0][0] if self.queue else None
+
+    def _push(self, event_id: int, event_date: datetime, offset: int) -> None:
+        key = (event_id, offset, event_date)
+        if key in self.queued:
+            return
+        self.queued.add(key)
+        heapq.heappush(self.queue, (event_date - timedelta(minutes=offset), event_id, offset, event_date))
+
+    def _unsent(self, queryset, offset: int):
+        sent = EventReminderLog.objects.filter(event=OuterRef('pk'), offset_minutes=offset, event_date=OuterRef('event_date'))
+        return queryset.filter(~Exists(sent)).values_list('pk', 'event_date')
+
+    def _load_window(self, now: datetime) -> None:
+        for offset in self.offsets:
+            upper = now + self.horizon + timedelta(minutes=offset)
+            lower = max(self.loaded_until[offset], now)
+            if upper <= lower:
+                continue
+            queryset = Event.objects.filter(event_date__gte=lower, event_date__lt=upper).order_by()
+            for event_id, event_date in self._unsent(queryset, offset):
+                self._push(event_id, event_date, offset)
+            self.loaded_until[offset] = upper
+
+    def _load_changes(self, now: datetime) -> None:
+        since, self.changes_since = self.changes_since - CHANGE_OVERLAP, now
+        for offset in self.offsets:
+            queryset = Event.objects.filter(
+                updated_at__gte=since,
+                event_date__gt=now,
+                event_date__lt=self.loaded_until[offset],
+            ).order_by()
+            for event_id, event_date in self._unsent(queryset, offset):
+                self._push(event_id, event_date, offset)
+
+    def _fire_due(self, now: datetime) -> int:
+        due = []
+        while self.queue and self.queue[0][0] <= now:
+            due_at, event_id, offset, event_date = heapq.heappop(self.queue)
+            self.queued.discard((event_id, offset, event_date))
+            due.append((event_id, offset, event_date))
+        if not due:
+            return 0
+
+        events = Event.objects.select_related('created_by').in_bulk({event_id for event_id, _, _ in due})
+        sent = 0
+        for event_id, offset, event_date in due:
+            event = events.get(event_id)
+            # Deleted, rescheduled (the new date has its own entry) or already started.
+            if event is None or event.event_date != event_date or event.event_date <= now:
+                continue
+            if self._superseded(offset, event_date, now):
+                continue
+            if self._send(event, offset, now):
+                sent += 1
+        return sent
+
+    def _superseded(self, offset: int, event_date: datetime, now: datetime) -> bool:
+        """True when a smaller offset is due by the end of the grace period; only that one is sent."""
+        return any(
+            event_date - timedelta(minutes=smaller) <= now + self.grace
+            for smaller in self.offsets
+            if smaller < offset
+        )
+
+    @staticmethod
+    def _send(event: Event, offset: int, now: datetime) -> bool:
+        try:
+            with transaction.atomic():
+                log = EventReminderLog.objects.create(event=event, offset_minutes=offset, event_date=event.event_date)
+                log.notification = queue_event_scheduled_reminder(event, now)
+                log.save(update_fields=['notification'])
+        except IntegrityError:
+            # Another worker (or a previous run) already sent it.
+            return False
+        logger.info("Queued %s-minute reminder for event %s.", offset, event.pk)
+        return True
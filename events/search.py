@@ -0,0 +1,103 @@
+"""
+Full-text search over event titles and descriptions.
+
+PostgreSQL uses a GIN expression index over `SEARCH_DOCUMENT_SQL`; SQLite uses
+the `events_event_fts` FTS5 table kept in sync by triggers. Both are created by
+migration `0005_event_search_index` and are maintained by the database itself,
+so `bulk_create` and queryset updates stay indexed too. Other databases fall
+back to unindexed `icontains` matching.
+"""
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from .models import Event
+
+SEARCH_CONFIG = 'english'
+SEARCH_DOCUMENT_SQL = (
+    f"to_tsvector('{SEARCH_CONFIG}', coalesce(title, '') || ' ' || coalesce(description, ''))"
+)
+SQLITE_FTS_TABLE = 'events_event_fts'
+
+_sqlite_fts_ready = None
+
+
+def _has_sqlite_fts() -> bool:
+    global _sqlite_fts_ready
+    if _sqlite_fts_ready is None:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [SQLITE_FTS_TABLE])
+            _sqlite_fts_ready = cursor.fetchone() is not None
+    return _sqlite_fts_ready
+
+
+def search_backend() -> str:
+    if connection.vendor == 'postgresql':
+        return 'postgresql'
+    if connection.vendor == 'sqlite' and _has_sqlite_fts():
+        return 'sqlite'
+    return 'fallback'
+
+
+def _fts5_query(query: str) -> str:
+    # Quote every term so user input can never be parsed as FTS5 syntax; the
+    # trailing `*` makes each term a prefix match.
+    terms = re.findall(r'\w+', query)
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def search_event_ids(query: str, limit: int = 20) -> list[int]:
+    """Return ids of the events best matching `query`, most relevant first."""
+    backend = search_backend()
+    if backend == 'postgresql':
+        sql = (
+            f"SELECT id FROM events_event "
+            f"WHERE {SEARCH_DOCUMENT_SQL} @@ websearch_to_tsquery('{SEARCH_CONFIG}', %s) "
+            f"ORDER BY ts_rank({SEARCH_DOCUMENT_SQL}, websearch_to_tsquery('{SEARCH_CONFIG}', %s)) DESC, event_date "
+            f"LIMIT %s"
+        )
+        params = [query, query, limit]
+    elif backend == 'sqlite':
+        match = _fts5_query(query)
+        if not match:
+            return []
+        sql = f"SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH %s ORDER BY bm25({SQLITE_FTS_TABLE}) LIMIT %s"
+        params = [match, limit]
+    else:
+        return list(
+            Event.objects.filter(Q(title__icontains=query) | Q(description__icontains=query))
+            .values_list('id', flat=True)[:limit]
+        )
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def search_events(queryset, query: str, limit: int = 20) -> list[Event]:
+    """Resolve ranked ids against `queryset`, preserving search order."""
+    ids = search_event_ids(query, limit=limit)
+    events = queryset.in_bulk(ids)
+    return [events[event_id] for event_id in ids if event_id in events]
+
+
+def filter_events(queryset, query: str):
+    """
+    Narrow `queryset` to events matching `query` through the same index as
+    `search_event_ids`, without ranking or a limit, so it composes with other
+    filters and pagination.
+    """
+    backend = search_backend()
+    if backend == 'postgresql':
+        sql = f"SELECT id FROM events_event WHERE {SEARCH_DOCUMENT_SQL} @@ websearch_to_tsquery('{SEARCH_CONFIG}', %s)"
+        return queryset.filter(pk__in=RawSQL(sql, [query]))
+    if backend == 'sqlite':
+        match = _fts5_query(query)
+        if not match:
+            return queryset.none()
+        sql = f"SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH %s"
+        return queryset.filter(pk__in=RawSQL(sql, [match]))
+    # No full-text index: a leading-wildcard scan, bounded by the 255-character input cap.
+    return queryset.filter(Q(title__icontains=query) | Q(description__icontains=query))
@@ -1,12 +1,34 @@
 from django.contrib.auth import get_user_model
-from rest_framework import serializers
+from rest_framework import permissions, serializers
 
 from .models import Event
 
 User = get_user_model()
 
 
-class EventSerializer(serializers.ModelSerializer):
+class SparseFieldsetMixin:
+    """
+    Limit serialized output to the comma-separated `?fields=` of a read request.
+    The primary key is always kept so clients can address the rows they get.
+    """
+
+    always_included_fields = ('id',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is None or request.method not in permissions.SAFE_METHODS:
+            return
+        requested = request.query_params.get('fields')
+        if not requested:
+            return
+        allowed = {name.strip() for name in requested.split(',') if name.strip()}
+        allowed.update(self.always_included_fields)
+        for name in set(self.fields) - allowed:
+            self.fields.pop(name)
+
+
+class EventSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     created_by_name = serializers.CharField(source='created_by.get_full_name', read_only=True)
     created_by_email = serializers.EmailField(source='created_by.email', read_only=True)
 
@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent after events are inserted with `bulk_create`, which skips `post_save`.
+# Receivers get `sender=Event` and `count`.
+events_bulk_created = Signal()
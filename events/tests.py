@@ -1,3 +1,644 @@
-from django.test import TestCase
+import json
+import time
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import AsyncRequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from . import ical
+from .async_views import AsyncEventListCreateView, AsyncEventReminderView
+from .models import Event, EventReminderLog, NotificationOutbox
+from .notifications import _dispatch_event_email, _iter_recipients, process_outbox
+from .reminders import ReminderScheduler
+
+User = get_user_model()
+
+
+@override_settings(
+    EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+    DEFAULT_FROM_EMAIL='noreply@plansync.test',
+)
+class NotificationOutboxTests(APITestCase):
+    def setUp(self):
+        self.creator = User.objects.create_user(username='creator@example.com', email='creator@example.com', password='pass12345')
+        self.guest = User.objects.create_user(username='guest@example.com', email='guest@example.com', password='pass12345')
+        self.client.force_authenticate(self.creator)
+
+    def _create_event(self):
+        return self.client.post(
+            reverse('event-list-create'),
+            {'title': 'Launch', 'event_date': (timezone.now() + timedelta(days=2)).isoformat()},
+            format='json',
+        )
+
+    def test_create_queues_notification_without_sending(self):
+        response = self._create_event()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(mail.outbox), 0)
+        notification = NotificationOutbox.objects.get()
+        self.assertEqual(notification.status, NotificationOutbox.STATUS_PENDING)
+        self.assertEqual(notification.event_id, response.data['id'])
+
+    def test_worker_delivers_and_excludes_creator(self):
+        self._create_event()
+
+        call_command('process_notifications', '--once', stdout=StringIO())
+
+        recipients = [message.to for message in mail.outbox]
+        self.assertIn(['guest@example.com'], recipients)
+        self.assertNotIn(['creator@example.com'], recipients)
+        notification = NotificationOutbox.objects.get()
+        self.assertEqual(notification.status, NotificationOutbox.STATUS_SENT)
+        self.assertEqual(notification.sent_count, len(mail.outbox))
+
+    def test_reminder_is_queued(self):
+        event = Event.objects.create(title='Sync', event_date=timezone.now(), created_by=self.creator)
+
+        response = self.client.post(reverse('event-reminder', args=[event.pk]))
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(NotificationOutbox.objects.filter(event=event).count(), 1)
+
+    @override_settings(NOTIFICATION_OUTBOX_MAX_ATTEMPTS=2, EMAIL_BACKEND='events.tests.FailingEmailBackend')
+    def test_failed_delivery_is_retried_then_abandoned(self):
+        self._create_event()
+        notification = NotificationOutbox.objects.get()
+
+        process_outbox()
+        notification.refresh_from_db()
+        self.assertEqual(notification.status, NotificationOutbox.STATUS_PENDING)
+        self.assertGreater(notification.available_at, timezone.now())
+
+        NotificationOutbox.objects.update(available_at=timezone.now())
+        process_outbox()
+        notification.refresh_from_db()
+        self.assertEqual(notification.status, NotificationOutbox.STATUS_FAILED)
+        self.assertEqual(notification.attempts, 2)
+
+    @override_settings(EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend', EMAIL_HOST_USER='', EMAIL_HOST_PASSWORD='')
+    def test_unconfigured_email_keeps_notification_for_retry(self):
+        self._create_event()
+
+        process_outbox()
+
+        notification = NotificationOutbox.objects.get()
+        self.assertEqual(notification.status, NotificationOutbox.STATUS_PENDING)
+        self.assertEqual(notification.sent_count, 0)
+        self.assertEqual(notification.last_error, "Email is not configured.")
+
+    @override_settings(NOTIFICATION_BATCH_SIZE=2)
+    def test_bulk_dispatch_reports_partial_failures(self):
+        for index in range(5):
+            User.objects.create_user(username=f'user{index}@example.com', email=f'user{index}@example.com', password='pass12345')
+        FlakyEmailBackend.calls = 0
+
+        with override_settings(EMAIL_BACKEND='events.tests.FlakyEmailBackend'):
+            report = _dispatch_event_email('Subject', 'Body')
+
+        self.assertEqual(report.batches, 4)
+        self.assertEqual(report.failed_batches, 1)
+        self.assertEqual(report.failed, 2)
+        self.assertEqual(report.sent, User.objects.count() - 2)
+
+    def test_recipient_chunks_exclude_case_insensitively(self):
+        for index in range(5):
+            User.objects.create_user(username=f'user{index}@example.com', email=f'user{index}@example.com', password='pass12345')
+
+        chunks = list(_iter_recipients(exclude=['CREATOR@example.com'], chunk_size=3))
+
+        recipients = [email for chunk in chunks for email in chunk]
+        self.assertTrue(all(len(chunk) <= 3 for chunk in chunks))
+        self.assertNotIn('creator@example.com', recipients)
+        self.assertEqual(len(recipients), len(set(recipients)))
+        self.assertEqual(len(recipients), User.objects.count() - 1)
+
+
+class EventListTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner@example.com', email='owner@example.com', password='pass12345')
+        start = timezone.now()
+        # Pairs share an event_date so the id tie-breaker is exercised.
+        for index in range(6):
+            Event.objects.create(
+                title=f'Event {index}',
+                description='Long agenda',
+                event_date=start + timedelta(days=index // 2),
+                created_by=self.owner,
+            )
+
+    def test_list_is_cursor_paginated_without_gaps(self):
+        url = reverse('event-list-create')
+        seen = []
+        response = self.client.get(url, {'page_size': 4})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(item['id'] for item in response.data['results'])
+            if not response.data['next']:
+                break
+            response = self.client.get(response.data['next'])
+
+        expected = list(Event.objects.order_by('event_date', 'id').values_list('id', flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_fields_parameter_limits_serialized_output(self):
+        response = self.client.get(reverse('event-list-create'), {'fields': 'title,event_date'})
+
+        self.assertEqual(set(response.data['results'][0]), {'id', 'title', 'event_date'})
+
+    def test_list_filters_by_window_creator_and_title(self):
+        other = User.objects.create_user(username='other@example.com', email='other@example.com', password='pass12345')
+        Event.objects.create(title='Quarterly review', event_date=timezone.now() + timedelta(days=1), created_by=other)
+        url = reverse('event-list-create')
+        window_start = timezone.now() + timedelta(hours=12)
+
+        windowed = self.client.get(url, {'start': window_start.isoformat(), 'end': (window_start + timedelta(days=1)).isoformat()})
+        by_creator = self.client.get(url, {'created_by': other.pk})
+        searched = self.client.get(url, {'search': 'REVIEW', 'upcoming': 'true'})
+
+        self.assertEqual([item['title'] for item in windowed.data['results']], ['Event 2', 'Event 3', 'Quarterly review'])
+        self.assertEqual([item['title'] for item in by_creator.data['results']], ['Quarterly review'])
+        self.assertEqual([item['title'] for item in searched.data['results']], ['Quarterly review'])
+
+    def test_search_filter_matches_word_prefixes_through_the_index(self):
+        Event.objects.create(title='Offsite', description='Budget planning for Q3', event_date=timezone.now() + timedelta(days=2), created_by=self.owner)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('event-list-create'), {'search': 'budg'})
+
+        self.assertEqual([item['title'] for item in response.data['results']], ['Offsite'])
+        self.assertIn('events_event_fts', queries.captured_queries[-1]['sql'])
+
+    def test_invalid_filter_window_is_rejected(self):
+        response = self.client.get(reverse('event-list-create'), {'start': '2025-05-02', 'end': '2025-05-01'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_query_count_does_not_grow_with_events(self):
+        creators = [
+            User.objects.create_user(username=f'host{index}@example.com', email=f'host{index}@example.com', password='pass12345')
+            for index in range(20)
+        ]
+        start = timezone.now()
+        Event.objects.bulk_create(
+            Event(title=f'Bulk {index}', event_date=start + timedelta(minutes=index), created_by=creators[index % len(creators)])
+            for index in range(1000)
+        )
+        url = reverse('event-list-create')
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {'page_size': 200})
+        self.assertEqual(len(response.data['results']), 200)
+        self.assertTrue(all(item['created_by_email'] for item in response.data['results']))
+
+        pages = 1
+        while response.data['next']:
+            with self.assertNumQueries(1):
+                response = self.client.get(response.data['next'])
+            pages += 1
+        self.assertEqual(pages, 6)
+
+    def test_unchanged_list_returns_not_modified(self):
+        url = reverse('event-list-create')
+        first = self.client.get(url)
+
+        with self.assertNumQueries(1):
+            repeat = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(repeat.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Event.objects.filter(title='Event 0').delete()
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+
+    def test_list_validates_by_etag_only(self):
+        url = reverse('event-list-create')
+        first = self.client.get(url)
+
+        self.assertNotIn('Last-Modified', first)
+        self.assertIn('Authorization', first['Vary'])
+        Event.objects.filter(title='Event 0').delete()
+        changed = self.client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 60))
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+
+    def test_detail_honours_if_modified_since(self):
+        event = Event.objects.first()
+        url = reverse('event-detail', args=[event.pk])
+        first = self.client.get(url)
+
+        repeat = self.client.get(url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+
+        self.assertEqual(repeat.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+class EventSearchTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner@example.com', email='owner@example.com', password='pass12345')
+        now = timezone.now()
+        self.offsite = Event.objects.create(title='Team offsite', description='Planning in the mountains', event_date=now, created_by=self.owner)
+        self.review = Event.objects.create(title='Budget review', description='Quarterly planning numbers', event_date=now, created_by=self.owner)
+        Event.objects.create(title='Standup', description='Daily sync', event_date=now, created_by=self.owner)
+
+    def test_search_matches_title_and_description_by_relevance(self):
+        response = self.client.get(reverse('event-search'), {'q': 'planning'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual({item['id'] for item in response.data['results']}, {self.offsite.pk, self.review.pk})
+
+    def test_index_follows_updates_and_deletes(self):
+        self.review.title = 'Budget retro'
+        self.review.save()
+        self.offsite.delete()
+
+        retro = self.client.get(reverse('event-search'), {'q': 'retro'})
+        offsite = self.client.get(reverse('event-search'), {'q': 'offsite'})
+
+        self.assertEqual([item['id'] for item in retro.data['results']], [self.review.pk])
+        self.assertEqual(offsite.data['results'], [])
+
+    def test_query_syntax_characters_are_treated_as_text(self):
+        response = self.client.get(reverse('event-search'), {'q': '"budget* (-'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['id'] for item in response.data['results']], [self.review.pk])
+
+
+@override_settings(EVENT_IMPORT_CHUNK_SIZE=2, EVENT_EXPORT_CHUNK_SIZE=2)
+class EventBulkTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner@example.com', email='owner@example.com', password='pass12345')
+        self.client.force_authenticate(self.owner)
+
+    def _import(self, body, content_type):
+        return self.client.post(reverse('event-import'), data=body, content_type=content_type)
+
+    def test_csv_import_creates_events_and_queues_one_digest(self):
+        body = 'title,description,event_date\n' + ''.join(f'Session {index},,2030-01-0{index}T10:00:00Z\n' for index in range(1, 6))
+
+        response = self._import(body, 'text/csv')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data, {'created': 5})
+        self.assertEqual(Event.objects.filter(created_by=self.owner).count(), 5)
+        digest = NotificationOutbox.objects.get()
+        self.assertEqual(digest.subject, '5 new events scheduled')
+        self.assertEqual(digest.exclude, ['owner@example.com'])
+
+    def test_invalid_row_rolls_back_the_whole_import(self):
+        body = '{"title": "Ok", "event_date": "2030-01-01T10:00:00Z"}\n{"title": "", "event_date": "soon"}\n'
+
+        response = self._import(body, 'application/x-ndjson')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'][0]['row'], 2)
+        self.assertFalse(Event.objects.exists())
+        self.assertFalse(NotificationOutbox.objects.exists())
+
+    def test_icalendar_upload_is_parsed_from_file(self):
+        calendar = (
+            'BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nSUMMARY:Board meeting\\, Q1\r\n'
+            'DESCRIPTION:Agenda\\nBudget\r\nDTSTART:20300115T090000Z\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n'
+        )
+        upload = SimpleUploadedFile('calendar.ics', calendar.encode(), content_type='text/calendar')
+
+        response = self.client.post(reverse('event-import'), {'file': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        event = Event.objects.get()
+        self.assertEqual(event.title, 'Board meeting, Q1')
+        self.assertEqual(event.description, 'Agenda\nBudget')
+        self.assertEqual(event.event_date.isoformat(), '2030-01-15T09:00:00+00:00')
+
+    def test_export_streams_filtered_rows_in_both_formats(self):
+        for day in range(1, 6):
+            Event.objects.create(title=f'Day {day}', event_date=f'2030-02-0{day}T10:00:00Z', created_by=self.owner)
+
+        csv_response = self.client.get(reverse('event-export'), {'start': '2030-02-02', 'end': '2030-02-05'})
+        jsonl_response = self.client.get(reverse('event-export'), {'format': 'jsonl', 'search': 'Day 5'})
+
+        self.assertTrue(csv_response.streaming)
+        csv_lines = b''.join(csv_response.streaming_content).decode().splitlines()
+        self.assertEqual(csv_lines[0], 'id,title,description,event_date,created_by,created_by_email,created_at,updated_at')
+        self.assertEqual([line.split(',')[1] for line in csv_lines[1:]], ['Day 2', 'Day 3', 'Day 4'])
+        self.assertEqual(csv_response['Content-Disposition'], 'attachment; filename="events.csv"')
+        rows = b''.join(jsonl_response.streaming_content).decode().splitlines()
+        self.assertEqual(len(rows), 1)
+        self.assertIn('"created_by_email": "owner@example.com"', rows[0])
+
+    def test_exported_csv_can_be_imported_again(self):
+        Event.objects.create(title='Roundtrip', description='Keeps, commas', event_date=timezone.now(), created_by=self.owner)
+        exported = b''.join(self.client.get(reverse('event-export')).streaming_content).decode()
+
+        response = self._import(exported, 'text/csv')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Event.objects.filter(description='Keeps, commas').count(), 2)
+
+
+class EventFeedTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username='owner@example.com', email='owner@example.com', password='pass12345', first_name='Ada', last_name='Lovelace'
+        )
+        self.other = User.objects.create_user(username='other@example.com', email='other@example.com', password='pass12345')
+        self.launch = Event.objects.create(
+            title='Launch; v2, final', description='Line one\nLine two', event_date='2030-03-01T09:30:00Z', created_by=self.owner
+        )
+        Event.objects.create(title='Other team', event_date='2030-03-02T09:30:00Z', created_by=self.other)
+
+    def _body(self, response):
+        return b''.join(response.streaming_content).decode()
+
+    def test_global_feed_streams_escaped_vevents(self):
+        response = self.client.get(reverse('event-feed'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/calendar; charset=utf-8')
+        body = self._body(response)
+        self.assertTrue(body.startswith('BEGIN:VCALENDAR\r\n'))
+        self.assertTrue(body.endswith('END:VCALENDAR\r\n'))
+        self.assertEqual(body.count('BEGIN:VEVENT'), 2)
+        self.assertIn('SUMMARY:Launch\\; v2\\, final\r\n', body)
+        self.assertIn('DESCRIPTION:Line one\\nLine two\r\n', body)
+        self.assertIn('DTSTART:20300301T093000Z\r\n', body)
+        self.assertIn('ORGANIZER;CN="Ada Lovelace":urn:uuid:', body)
+        self.assertIn('ORGANIZER:urn:uuid:', body)
+        self.assertNotIn('@example.com', body)
+
+    def _feed_url(self, user):
+        self.client.force_authenticate(user)
+        url = self.client.get(reverse('event-feed-token')).data['url']
+        self.client.force_authenticate(None)
+        return url
+
+    def test_user_feed_only_contains_that_users_events(self):
+        body = self._body(self.client.get(self._feed_url(self.owner)))
+        missing = self.client.get(reverse('user-event-feed', args=[self.owner.pk]))
+
+        self.assertEqual(body.count('BEGIN:VEVENT'), 1)
+        self.assertIn(f'UID:event-{self.launch.pk}@plansync', body)
+        self.assertIn('X-WR-CALNAME:Ada Lovelace - PlanSync events', body)
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_unnamed_user_feed_does_not_fall_back_to_email(self):
+        body = self._body(self.client.get(self._feed_url(self.other)))
+
+        self.assertIn('X-WR-CALNAME:PlanSync events\r\n', body)
+        self.assertNotIn('other@example.com', body)
+
+    def test_rotated_and_revoked_tokens_stop_working(self):
+        old_url = self._feed_url(self.owner)
+        self.client.force_authenticate(self.owner)
+        new_url = self.client.post(reverse('event-feed-token')).data['url']
+
+        self.assertEqual(self.client.get(old_url).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.get(new_url).status_code, status.HTTP_200_OK)
+        self.client.delete(reverse('event-feed-token'))
+        self.assertEqual(self.client.get(new_url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_unchanged_feed_returns_not_modified(self):
+        first = self.client.get(reverse('event-feed'))
+
+        repeat = self.client.get(reverse('event-feed'), HTTP_IF_NONE_MATCH=first['ETag'])
+        self.launch.title = 'Launch moved'
+        self.launch.save()
+        changed = self.client.get(reverse('event-feed'), HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(repeat.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+
+    def test_refresh_only_renders_changed_events(self):
+        self._body(self.client.get(reverse('event-feed')))
+        self.launch.title = 'Launch moved'
+        self.launch.save()
+
+        with mock.patch.object(ical, 'render_vevent', wraps=ical.render_vevent) as render:
+            body = self._body(self.client.get(reverse('event-feed')))
+
+        self.assertEqual([call.args[0]['id'] for call in render.call_args_list], [self.launch.pk])
+        self.assertIn('SUMMARY:Launch moved\r\n', body)
+
+    def test_long_lines_are_folded(self):
+        self.launch.description = 'é' * 100
+        self.launch.save()
+
+        body = self._body(self.client.get(self._feed_url(self.owner)))
+
+        self.assertTrue(all(len(line.encode()) <= 75 for line in body.split('\r\n')))
+        self.assertEqual(list(ical.parse_vevents(body.splitlines(keepends=True)))[0]['description'], 'é' * 100)
+
+
+class ReminderSchedulerTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner@example.com', email='owner@example.com', password='pass12345')
+        self.now = timezone.now()
+
+    def _event(self, starts_in, **kwargs):
+        return Event.objects.create(title='Sync', event_date=self.now + starts_in, created_by=self.owner, **kwargs)
+
+    def _scheduler(self):
+        return ReminderScheduler(offsets=[60, 1440], horizon=600, now=self.now)
+
+    def test_due_reminders_are_queued_once_per_offset(self):
+        soon = self._event(timedelta(minutes=30))
+        tomorrow = self._event(timedelta(hours=23))
+        self._event(timedelta(days=5))
+        self._event(-timedelta(minutes=5))
+
+        sent = self._scheduler().tick(now=self.now)
+
+        self.assertEqual(sent, 2)
+        self.assertEqual(
+            set(EventReminderLog.objects.values_list('event_id', 'offset_minutes')),
+            {(soon.pk, 60), (tomorrow.pk, 1440)},
+        )
+        self.assertEqual(
+            set(NotificationOutbox.objects.values_list('subject', flat=True)),
+            {'Reminder: Sync starts in 30 minutes', 'Reminder: Sync starts in 23 hours'},
+        )
+
+    def test_overdue_reminder_gives_way_to_a_nearer_one(self):
+        event = self._event(timedelta(minutes=61))
+        scheduler = self._scheduler()
+
+        before = scheduler.tick(now=self.now)
+        after = scheduler.tick(now=self.now + timedelta(minutes=1))
+
+        self.assertEqual((before, after), (0, 1))
+        self.assertEqual(list(EventReminderLog.objects.values_list('event_id', 'offset_minutes')), [(event.pk, 60)])
+        self.assertEqual(NotificationOutbox.objects.get().subject, 'Reminder: Sync starts in 1 hour')
+
+    def test_restart_does_not_resend(self):
+        self._event(timedelta(minutes=30))
+        self._scheduler().tick(now=self.now)
+
+        sent = self._scheduler().tick(now=self.now + timedelta(minutes=1))
+
+        self.assertEqual(sent, 0)
+        self.assertEqual(NotificationOutbox.objects.count(), 1)
+
+    def test_reminders_fire_as_the_window_advances(self):
+        event = self._event(timedelta(hours=3))
+        scheduler = self._scheduler()
+        scheduler.tick(now=self.now)
+
+        before = scheduler.tick(now=self.now + timedelta(minutes=115))
+        after = scheduler.tick(now=self.now + timedelta(minutes=121))
+
+        self.assertEqual(before, 0)
+        self.assertEqual(after, 1)
+        self.assertTrue(EventReminderLog.objects.filter(event=event, offset_minutes=60).exists())
+
+    def test_new_and_rescheduled_events_inside_the_loaded_window(self):
+        scheduler = self._scheduler()
+        scheduler.tick(now=self.now)
+        added = self._event(timedelta(hours=2))
+        moved = self._event(timedelta(hours=30))
+
+        moved.event_date = self.now + timedelta(minutes=90)
+        moved.save()
+        scheduler.tick(now=self.now + timedelta(minutes=1))
+        sent = scheduler.tick(now=self.now + timedelta(minutes=45))
+
+        self.assertEqual(sent, 1)
+        self.assertEqual(
+            set(EventReminderLog.objects.values_list('event_id', 'offset_minutes')),
+            {(added.pk, 1440), (moved.pk, 1440), (moved.pk, 60)},
+        )
+
+    def test_rescheduled_queue_entries_are_dropped(self):
+        event = self._event(timedelta(minutes=100))
+        scheduler = self._scheduler()
+        scheduler.tick(now=self.now)
+
+        event.event_date = self.now + timedelta(days=3)
+        event.save()
+        sent = scheduler.tick(now=self.now + timedelta(minutes=45))
+
+        self.assertEqual(sent, 0)
+        self.assertFalse(EventReminderLog.objects.filter(offset_minutes=60).exists())
+
+    def test_command_runs_a_single_pass(self):
+        self._event(timedelta(minutes=30))
+        output = StringIO()
+
+        call_command('run_reminder_scheduler', '--once', stdout=output)
+
+        self.assertIn('Queued 1 reminder(s).', output.getvalue())
+
+
+class AsyncEventViewTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner@example.com', email='owner@example.com', password='pass12345')
+        self.other = User.objects.create_user(username='other@example.com', email='other@example.com', password='pass12345')
+        now = timezone.now()
+        for day in range(1, 6):
+            Event.objects.create(title=f'Day {day}', event_date=now + timedelta(days=day), created_by=self.owner)
+        self.factory = AsyncRequestFactory()
+
+    def _headers(self, user):
+        return {'Authorization': f'Bearer {AccessToken.for_user(user)}'}
+
+    async def test_list_matches_sync_view(self):
+        params = {'page_size': 2, 'search': 'Day', 'fields': 'title'}
+        expected = await self.async_client.get(reverse('event-list-create'), params)
+
+        response = await AsyncEventListCreateView.as_view()(self.factory.get('/api/events/', params))
+        repeat = await AsyncEventListCreateView.as_view()(
+            self.factory.get('/api/events/', params, headers={'If-None-Match': response['ETag']})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content), expected.json())
+        self.assertEqual(response['ETag'], expected['ETag'])
+        self.assertEqual(repeat.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_create_requires_authentication_and_queues_notification(self):
+        payload = json.dumps({'title': 'Async launch', 'event_date': '2030-01-01T10:00:00Z'})
+        anonymous = await AsyncEventListCreateView.as_view()(
+            self.factory.post('/api/events/', payload, content_type='application/json')
+        )
+        response = await AsyncEventListCreateView.as_view()(
+            self.factory.post('/api/events/', payload, content_type='application/json', headers=self._headers(self.owner))
+        )
+
+        self.assertEqual(anonymous.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        body = json.loads(response.content)
+        self.assertEqual(body['created_by_email'], 'owner@example.com')
+        self.assertEqual(await NotificationOutbox.objects.filter(event_id=body['id']).acount(), 1)
+
+    async def test_reminder_is_queued_for_owners_only(self):
+        event = await Event.objects.afirst()
+        view = AsyncEventReminderView.as_view()
+
+        denied = await view(self.factory.post(f'/api/events/{event.pk}/remind/', headers=self._headers(self.other)), pk=event.pk)
+        accepted = await view(self.factory.post(f'/api/events/{event.pk}/remind/', headers=self._headers(self.owner)), pk=event.pk)
+        missing = await view(self.factory.post('/api/events/999/remind/', headers=self._headers(self.owner)), pk=999)
+
+        self.assertEqual(denied.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(accepted.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(await NotificationOutbox.objects.filter(event=event).acount(), 1)
+
+
+class FlakyEmailBackend:
+    """Fails the first batch it is handed, then behaves like locmem."""
+
+    calls = 0
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def send_messages(self, messages):
+        FlakyEmailBackend.calls += 1
+        if FlakyEmailBackend.calls == 1:
+            raise ConnectionResetError("connection dropped")
+        return len(messages)
+
+
+class FailingEmailBackend:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def send_messages(self, messages):
+        raise ConnectionRefusedError("SMTP unavailable")
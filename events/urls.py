@@ -1,9 +1,30 @@
+from django.conf import settings
 from django.urls import path
 
-from .views import EventDetailView, EventListCreateView, EventReminderView
+from .views import (
+    CalendarFeedTokenView,
+    EventDetailView,
+    EventExportView,
+    EventFeedView,
+    EventImportView,
+    EventListCreateView,
+    EventReminderView,
+    EventSearchView,
+    UserEventFeedView,
+)
+
+if settings.ASYNC_VIEWS:
+    from .async_views import AsyncEventListCreateView as EventListCreateView  # noqa: F811
+    from .async_views import AsyncEventReminderView as EventReminderView  # noqa: F811
 
 urlpatterns = [
     path('', EventListCreateView.as_view(), name='event-list-create'),
+    path('import/', EventImportView.as_view(), name='event-import'),
+    path('export/', EventExportView.as_view(), name='event-export'),
+    path('feed.ics', EventFeedView.as_view(), name='event-feed'),
+    path('feed/token/', CalendarFeedTokenView.as_view(), name='event-feed-token'),
+    path('feed/<str:token>.ics', UserEventFeedView.as_view(), name='user-event-feed'),
+    path('search/', EventSearchView.as_view(), name='event-search'),
     path('<int:pk>/', EventDetailView.as_view(), name='event-detail'),
     path('<int:pk>/remind/', EventReminderView.as_view(), name='event-reminder'),
 ]
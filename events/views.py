@@ -1,46 +1,227 @@
+import os
+
+from django.db import transaction
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
-from rest_framework import generics, permissions, status
+from django.urls import reverse
+from rest_framework import generics, permissions, serializers, status
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import Event
-from .notifications import send_event_created_notification, send_event_manual_reminder
+from config.conditional import ConditionalGetMixin
+
+from .bulk import import_events, stream_csv, stream_jsonl
+from .filters import EventFilterBackend
+from .ical import iter_calendar
+from .models import CalendarFeedToken, Event, generate_feed_token
+from .notifications import queue_event_created_notification, queue_event_manual_reminder
+from .pagination import EventCursorPagination
+from .parsers import PARSERS_BY_EXTENSION, CSVRowsParser, ICalendarRowsParser, JSONLinesRowsParser
+from .renderers import CSVRenderer, ICalendarRenderer, JSONLinesRenderer
+from .search import search_events
 from .serializers import EventSerializer
 
 
-class EventListCreateView(generics.ListCreateAPIView):
-    serializer_class = EventSerializer
-    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+class EventQuerysetMixin:
+    """
+    Shared queryset for event views: the creator is joined in the same query and
+    only the columns `EventSerializer` renders are fetched.
+    """
+
+    queryset_fields = (
+        'title',
+        'description',
+        'event_date',
+        'created_at',
+        'updated_at',
+        'created_by__first_name',
+        'created_by__last_name',
+        'created_by__email',
+    )
 
     def get_queryset(self):
         user = self.request.user
+        queryset = Event.objects.select_related('created_by').only(*self.queryset_fields)
         if self.request.method in permissions.SAFE_METHODS:
-            return Event.objects.all()
+            return queryset
         if getattr(user, 'is_admin', False) or user.is_staff or user.is_superuser:
-            return Event.objects.all()
-        return Event.objects.filter(created_by=user)
+            return queryset
+        return queryset.filter(created_by=user)
+
+
+class EventListCreateView(ConditionalGetMixin, EventQuerysetMixin, generics.ListCreateAPIView):
+    serializer_class = EventSerializer
+    pagination_class = EventCursorPagination
+    filter_backends = [EventFilterBackend]
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     def perform_create(self, serializer):
-        event = serializer.save(created_by=self.request.user)
-        send_event_created_notification(event)
+        # The outbox row commits atomically with the event; delivery happens in
+        # the `process_notifications` worker, off the request path.
+        with transaction.atomic():
+            event = serializer.save(created_by=self.request.user)
+            queue_event_created_notification(event)
 
 
-class EventDetailView(generics.RetrieveUpdateDestroyAPIView):
+class EventDetailView(ConditionalGetMixin, EventQuerysetMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = EventSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
-    def get_queryset(self):
-        user = self.request.user
-        if self.request.method in permissions.SAFE_METHODS:
-            return Event.objects.all()
-        if getattr(user, 'is_admin', False) or user.is_staff or user.is_superuser:
-            return Event.objects.all()
-        return Event.objects.filter(created_by=user)
-
     def perform_update(self, serializer):
         serializer.save(created_by=self.request.user)
 
 
+class EventSearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=255)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=20)
+
+
+class EventSearchView(EventQuerysetMixin, generics.GenericAPIView):
+    serializer_class = EventSerializer
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+
+    def get(self, request):
+        params = EventSearchQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        events = search_events(self.get_queryset(), params.validated_data['q'], limit=params.validated_data['limit'])
+        return Response(
+            {
+                'query': params.validated_data['q'],
+                'results': self.get_serializer(events, many=True).data,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class EventImportView(APIView):
+    """
+    Create events in bulk from a CSV, JSON lines or iCalendar body, or from a
+    multipart `file` upload whose extension picks the format. The import is
+    all-or-nothing and sends one digest notification rather than one per event.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [CSVRowsParser, JSONLinesRowsParser, ICalendarRowsParser, MultiPartParser]
+
+    def post(self, request):
+        created, errors = import_events(self._get_rows(request), created_by=request.user)
+        if errors:
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'created': created}, status=status.HTTP_201_CREATED)
+
+    @staticmethod
+    def _get_rows(request):
+        if not request.content_type.startswith('multipart/'):
+            return request.data
+        upload = request.FILES.get('file')
+        if upload is None:
+            raise ParseError("Upload the events as a 'file' field.")
+        parser_class = PARSERS_BY_EXTENSION.get(os.path.splitext(upload.name)[1].lower())
+        if parser_class is None:
+            raise ParseError(f"Unsupported file type. Use one of: {', '.join(sorted(PARSERS_BY_EXTENSION))}.")
+        return parser_class().parse(upload, parser_context={'encoding': 'utf-8'})
+
+
+class EventExportView(APIView):
+    """
+    Stream events as CSV (`?format=csv`, the default) or JSON lines
+    (`?format=jsonl`). Rows are read with `.iterator()` and written as they
+    arrive, so memory use does not grow with the size of the export.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [CSVRenderer, JSONLinesRenderer]
+    streams = {'csv': stream_csv, 'jsonl': stream_jsonl}
+
+    def get(self, request):
+        queryset = EventFilterBackend().filter_queryset(request, Event.objects.order_by('event_date', 'id'), self)
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(
+            self.streams[renderer.format](queryset),
+            content_type=f'{renderer.media_type}; charset={renderer.charset}',
+        )
+        response['Content-Disposition'] = f'attachment; filename="events.{renderer.format}"'
+        return response
+
+
+class ICalendarListMixin:
+    """
+    `list` for feed views: streams the filtered queryset as a VCALENDAR.
+    Sits behind `ConditionalGetMixin` so unchanged feeds still answer 304.
+    """
+
+    calendar_name = 'PlanSync events'
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        response = StreamingHttpResponse(iter_calendar(queryset, self.get_calendar_name()), content_type='text/calendar; charset=utf-8')
+        response['Content-Disposition'] = 'inline; filename="events.ics"'
+        return response
+
+    def get_calendar_name(self):
+        return self.calendar_name
+
+
+class EventFeedView(ConditionalGetMixin, ICalendarListMixin, generics.ListAPIView):
+    """
+    Subscribable `.ics` feed of every event. Calendar clients cannot send
+    bearer tokens, so feeds are public like the event list itself.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    renderer_classes = [ICalendarRenderer]
+    filter_backends = [EventFilterBackend]
+
+    def get_queryset(self):
+        return Event.objects.order_by('event_date', 'id')
+
+
+class UserEventFeedView(EventFeedView):
+    """A user's own events, addressed by their secret `CalendarFeedToken`."""
+
+    def get_queryset(self):
+        feed_token = get_object_or_404(CalendarFeedToken.objects.select_related('user'), token=self.kwargs['token'])
+        self.owner = feed_token.user
+        return super().get_queryset().filter(created_by=self.owner)
+
+    def get_calendar_name(self):
+        full_name = self.owner.get_full_name()
+        return f"{full_name} - PlanSync events" if full_name else self.calendar_name
+
+
+class CalendarFeedTokenView(APIView):
+    """
+    The signed-in user's feed URL: GET returns it (issuing a token on first
+    use), POST rotates the token and DELETE revokes it.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        feed_token, _ = CalendarFeedToken.objects.get_or_create(user=request.user)
+        return Response(self._payload(request, feed_token))
+
+    def post(self, request):
+        feed_token, _ = CalendarFeedToken.objects.update_or_create(
+            user=request.user,
+            defaults={'token': generate_feed_token()},
+        )
+        return Response(self._payload(request, feed_token), status=status.HTTP_201_CREATED)
+
+    def delete(self, request):
+        CalendarFeedToken.objects.filter(user=request.user).delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @staticmethod
+    def _payload(request, feed_token):
+        return {
+            'url': request.build_absolute_uri(reverse('user-event-feed', args=[feed_token.token])),
+            'created_at': feed_token.created_at,
+        }
+
+
 class EventReminderView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
@@ -49,10 +230,10 @@ class EventReminderView(APIView):
         if not self._user_can_manage(event, request.user):
             return Response({'detail': 'Not authorized to send reminders for this event.'}, status=status.HTTP_403_FORBIDDEN)
 
-        sent = send_event_manual_reminder(event, triggered_by=request.user)
+        queue_event_manual_reminder(event, triggered_by=request.user)
         return Response(
-            {'detail': f'Reminder sent to {sent} recipients.'},
-            status=status.HTTP_200_OK,
+            {'detail': 'Reminder queued for delivery.'},
+            status=status.HTTP_202_ACCEPTED,
         )
 
     @staticmethod
@@ -0,0 +1,43 @@
+# Generated by Django 5.0.4 on 2026-10-18 13:59
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_rating_counts(apps, schema_editor):
+    Feedback = apps.get_model('feedback', 'Feedback')
+    FeedbackRatingCount = apps.get_model('feedback', 'FeedbackRatingCount')
+    rows = Feedback.objects.order_by().values('rating').annotate(total=Count('id'))
+    FeedbackRatingCount.objects.bulk_create(
+        FeedbackRatingCount(rating=row['rating'], count=row['total']) for row in rows
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('feedback', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedbackRatingCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rating', models.PositiveSmallIntegerField(unique=True)),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['rating'],
+            },
+        ),
+        migrations.AlterModelOptions(
+            name='feedback',
+            options={'ordering': ['-created_at', '-id']},
+        ),
+        migrations.AddIndex(
+            model_name='feedback',
+            index=models.Index(fields=['-created_at', '-id'], name='feedback_recent_idx'),
+        ),
+        migrations.RunPython(backfill_rating_counts, migrations.RunPython.noop),
+    ]
@@ -9,8 +9,27 @@ class Feedback(models.Model):
     image = models.CharField(max_length=10, blank=True)  # store initials or URL
     created_at = models.DateTimeField(auto_now_add=True)
 
-    # class Meta:
-    #     ordering = ['-created_at']
+    class Meta:
+        ordering = ['-created_at', '-id']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='feedback_recent_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.rating}★)"
+
+
+class FeedbackRatingCount(models.Model):
+    """
+    Running count of feedback per rating value, kept in step with `Feedback`
+    inserts and deletes so aggregate stats never scan the feedback table.
+    """
+
+    rating = models.PositiveSmallIntegerField(unique=True)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['rating']
+
+    def __str__(self):
+        return f"{self.rating}★ × {self.count}"
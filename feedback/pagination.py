@@ -0,0 +1,39 @@
+import math
+
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class FeedbackCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the feedback list, newest first along
+    `feedback_recent_idx`, so a page never counts or scans the whole table.
+    """
+
+    ordering = ('-created_at', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+
+class TestimonialPagination(PageNumberPagination):
+    page_size = 12
+    page_size_query_param = 'page_size'
+    max_page_size = 50
+
+    def get_page_links(self, request, number: int, count: int) -> tuple:
+        """
+        (next, previous) links for page `number` of `count` rows, built from
+        this request's URL without querying, so cached pages link correctly
+        whichever host and scheme asked for them.
+        """
+        num_pages = max(1, math.ceil(count / self.get_page_size(request)))
+        url = request.build_absolute_uri()
+        next_link = replace_query_param(url, self.page_query_param, number + 1) if number < num_pages else None
+        if number <= 1:
+            previous_link = None
+        elif number == 2:
+            previous_link = remove_query_param(url, self.page_query_param)
+        else:
+            previous_link = replace_query_param(url, self.page_query_param, number - 1)
+        return next_link, previous_link
@@ -6,3 +6,4 @@ class FeedbackSerializer(serializers.ModelSerializer):
         model = Feedback
         fields = ['id', 'name', 'quote', 'rating', 'role', 'company', 'image', 'created_at']
         read_only_fields = ['id', 'created_at']
+        extra_kwargs = {'rating': {'min_value': 1, 'max_value': 5}}
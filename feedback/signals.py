@@ -0,0 +1,30 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Feedback
+from .stats import adjust_rating_count, invalidate_testimonials
+
+
+@receiver(pre_save, sender=Feedback)
+def remember_previous_rating(sender, instance, **kwargs):
+    instance._previous_rating = None
+    if instance.pk:
+        instance._previous_rating = Feedback.objects.filter(pk=instance.pk).values_list('rating', flat=True).first()
+
+
+@receiver(post_save, sender=Feedback)
+def count_saved_feedback(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_previous_rating', None)
+    if created or previous is None:
+        adjust_rating_count(instance.rating, 1)
+    elif previous != instance.rating:
+        adjust_rating_count(previous, -1)
+        adjust_rating_count(instance.rating, 1)
+    transaction.on_commit(invalidate_testimonials)
+
+
+@receiver(post_delete, sender=Feedback)
+def uncount_deleted_feedback(sender, instance, **kwargs):
+    adjust_rating_count(instance.rating, -1)
+    transaction.on_commit(invalidate_testimonials)
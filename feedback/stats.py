@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+
+from .models import FeedbackRatingCount
+
+RATING_VALUES = range(1, 6)
+TESTIMONIALS_VERSION_KEY = 'feedback:testimonials:version'
+
+
+def adjust_rating_count(rating: int, delta: int) -> None:
+    updated = FeedbackRatingCount.objects.filter(rating=rating).update(count=F('count') + delta)
+    if not updated and delta > 0:
+        counter, created = FeedbackRatingCount.objects.get_or_create(rating=rating, defaults={'count': delta})
+        if not created:
+            FeedbackRatingCount.objects.filter(pk=counter.pk).update(count=F('count') + delta)
+
+
+def get_rating_stats() -> dict:
+    """Average and per-rating histogram read from the running counters."""
+    histogram = {str(rating): 0 for rating in RATING_VALUES}
+    total = 0
+    rating_sum = 0
+    for rating, count in FeedbackRatingCount.objects.values_list('rating', 'count'):
+        histogram[str(rating)] = count
+        total += count
+        rating_sum += rating * count
+    return {
+        'total': total,
+        'average': round(rating_sum / total, 2) if total else None,
+        'histogram': histogram,
+    }
+
+
+def _testimonials_version() -> int:
+    version = cache.get(TESTIMONIALS_VERSION_KEY)
+    if version is None:
+        cache.add(TESTIMONIALS_VERSION_KEY, 1, timeout=None)
+        version = cache.get(TESTIMONIALS_VERSION_KEY, 1)
+    return version
+
+
+def testimonials_cache_key(page: str, page_size: str) -> str:
+    return f'feedback:testimonials:v{_testimonials_version()}:{page}:{page_size}'
+
+
+def get_cached_testimonials(key: str):
+    return cache.get(key)
+
+
+def set_cached_testimonials(key: str, payload) -> None:
+    cache.set(key, payload, timeout=settings.TESTIMONIALS_CACHE_TTL)
+
+
+def invalidate_testimonials() -> None:
+    try:
+        cache.incr(TESTIMONIALS_VERSION_KEY)
+    except ValueError:
+        cache.set(TESTIMONIALS_VERSION_KEY, 2, timeout=None)
@@ -1,3 +1,59 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from .models import Feedback
+
+
+class TestimonialsTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        for index, rating in enumerate([5, 4, 5, 3]):
+            Feedback.objects.create(name=f'Guest {index}', quote='Great tool', rating=rating)
+
+    def test_testimonials_are_newest_first_with_stats(self):
+        response = self.client.get(reverse('feedback-testimonials'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['name'] for item in response.data['results']], ['Guest 3', 'Guest 2', 'Guest 1', 'Guest 0'])
+        self.assertEqual(response.data['stats']['total'], 4)
+        self.assertEqual(response.data['stats']['average'], 4.25)
+        self.assertEqual(response.data['stats']['histogram'], {'1': 0, '2': 0, '3': 1, '4': 1, '5': 2})
+
+    def test_cached_page_is_refreshed_by_a_new_post(self):
+        self.client.get(reverse('feedback-testimonials'))
+        with self.assertNumQueries(0):
+            self.client.get(reverse('feedback-testimonials'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('feedback-list'), {'name': 'Newcomer', 'quote': 'Solid', 'rating': 1}, format='json')
+        response = self.client.get(reverse('feedback-testimonials'))
+
+        self.assertEqual(response.data['results'][0]['name'], 'Newcomer')
+        self.assertEqual(response.data['stats']['total'], 5)
+        self.assertEqual(response.data['stats']['histogram']['1'], 1)
+
+    def test_cached_page_links_follow_the_requesting_scheme(self):
+        url = reverse('feedback-testimonials')
+        first = self.client.get(url, {'page': 2, 'page_size': 1})
+        with self.assertNumQueries(0):
+            second = self.client.get(url, {'page': 2, 'page_size': 1}, secure=True)
+
+        self.assertEqual(first.data['next'], 'http://testserver/api/feedback/testimonials/?page=3&page_size=1')
+        self.assertEqual(second.data['next'], 'https://testserver/api/feedback/testimonials/?page=3&page_size=1')
+        self.assertEqual(second.data['previous'], 'https://testserver/api/feedback/testimonials/?page_size=1')
+        self.assertEqual(second.data['results'], first.data['results'])
+
+    def test_feedback_list_is_cursor_paginated_newest_first(self):
+        response = self.client.get(reverse('feedback-list'), {'page_size': 3})
+        rest = self.client.get(response.data['next'])
+
+        self.assertEqual([item['name'] for item in response.data['results']], ['Guest 3', 'Guest 2', 'Guest 1'])
+        self.assertEqual([item['name'] for item in rest.data['results']], ['Guest 0'])
+        self.assertIsNone(rest.data['next'])
+
+    def test_rating_outside_scale_is_rejected(self):
+        response = self.client.post(reverse('feedback-list'), {'name': 'Fan', 'quote': 'Wow', 'rating': 9}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
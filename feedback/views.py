@@ -1,10 +1,48 @@
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from config.conditional import ConditionalGetMixin
+from config.throttling import token_bucket_throttle
 from .models import Feedback
+from .pagination import FeedbackCursorPagination, TestimonialPagination
 from .serializers import FeedbackSerializer
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from .stats import get_cached_testimonials, get_rating_stats, set_cached_testimonials, testimonials_cache_key
+
 
-class feedbackViewSet(viewsets.ModelViewSet):
+class feedbackViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
+    last_modified_field = 'created_at'
     queryset = Feedback.objects.all()
     serializer_class = FeedbackSerializer
+    pagination_class = FeedbackCursorPagination
     permission_classes = [AllowAny]
+    throttle_classes = [token_bucket_throttle('feedback')]
     http_method_names = ['get', 'post', 'head', 'options']
+
+    @action(detail=False, methods=['get'], pagination_class=TestimonialPagination)
+    def testimonials(self, request):
+        """Newest-first, paginated testimonials with rating stats, cached per page."""
+        cache_key = testimonials_cache_key(
+            request.query_params.get('page', '1'),
+            request.query_params.get('page_size', ''),
+        )
+        # Only host-independent data is cached; page links follow each request.
+        cached = get_cached_testimonials(cache_key)
+        if cached is None:
+            page = self.paginate_queryset(self.get_queryset())
+            cached = {
+                'count': self.paginator.page.paginator.count,
+                'number': self.paginator.page.number,
+                'results': list(self.get_serializer(page, many=True).data),
+                'stats': get_rating_stats(),
+            }
+            set_cached_testimonials(cache_key, cached)
+        next_link, previous_link = self.paginator.get_page_links(request, cached['number'], cached['count'])
+        return Response({
+            'count': cached['count'],
+            'next': next_link,
+            'previous': previous_link,
+            'results': cached['results'],
+            'stats': cached['stats'],
+        })
@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+# Names are included because event writes put `get_full_name()` in notifications.
+CACHED_USER_FIELDS = ('id', 'email', 'first_name', 'last_name', 'is_admin', 'is_staff', 'is_superuser', 'is_active')
+
+
+def auth_user_cache_key(user_id) -> str:
+    return f'users:auth:v2:{user_id}'
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that resolves the token's user from a short-lived cache
+    entry holding `CACHED_USER_FIELDS` instead of querying `users_user` on every
+    request. The returned instance defers every other field, so code that reads
+    e.g. `first_name` still works at the cost of one lazy query. Entries are
+    dropped whenever the user is saved or deleted (see `users.signals`).
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # Revocation compares the password hash, which is not cached.
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        key = auth_user_cache_key(user_id)
+        record = cache.get(key)
+        if record is None:
+            record = (
+                self.user_model.objects.filter(**{api_settings.USER_ID_FIELD: user_id})
+                .values_list(*CACHED_USER_FIELDS)
+                .first()
+            )
+            if record is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            cache.set(key, record, timeout=settings.AUTH_USER_CACHE_TTL)
+
+        # from_db expects values in concrete field order; the rest stay deferred.
+        values = dict(zip(CACHED_USER_FIELDS, record))
+        field_names = [field.attname for field in self.user_model._meta.concrete_fields if field.attname in values]
+        user = self.user_model.from_db(DEFAULT_DB_ALIAS, field_names, [values[name] for name in field_names])
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+from django.utils import timezone
+
+User = get_user_model()
+
+
+def touch_last_login(user, now=None) -> bool:
+    """
+    Record a login, coalescing writes to at most one per
+    `LAST_LOGIN_UPDATE_INTERVAL` seconds per user. The write is a single
+    conditional UPDATE (no model save, signals or read-modify-write), so a burst
+    of logins for one account costs one row write instead of one per login.
+    Returns True when the row was written.
+    """
+    now = now or timezone.now()
+    threshold = now - timedelta(seconds=settings.LAST_LOGIN_UPDATE_INTERVAL)
+    if user.last_login and user.last_login > threshold:
+        return False
+
+    updated = (
+        User.objects.filter(pk=user.pk)
+        .filter(Q(last_login__isnull=True) | Q(last_login__lte=threshold))
+        .update(last_login=now)
+    )
+    user.last_login = now
+    return bool(updated)
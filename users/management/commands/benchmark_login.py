@@ -0,0 +1,66 @@
+import importlib.util
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory
+
+from config.load import percentile
+from config.seeding import BENCHMARK_EMAIL_DOMAIN, BENCHMARK_PASSWORD
+from users.views import LoginView
+
+User = get_user_model()
+
+BENCHMARK_EMAIL = f'login@{BENCHMARK_EMAIL_DOMAIN}'
+
+
+class Command(BaseCommand):
+    help = "Measure LoginView latency (p50/p99) and logins/second for each configured password hasher."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--logins', type=int, default=50)
+        parser.add_argument(
+            '--hashers',
+            default=','.join(settings.PASSWORD_HASHER_CLASSES),
+            help="Comma-separated PASSWORD_HASHER names to compare.",
+        )
+
+    def handle(self, *args, **options):
+        names = [name.strip() for name in options['hashers'].split(',') if name.strip()]
+        unknown = set(names) - set(settings.PASSWORD_HASHER_CLASSES)
+        if unknown:
+            raise CommandError(f"Unknown hasher(s): {', '.join(sorted(unknown))}")
+
+        view = LoginView.as_view()
+        factory = APIRequestFactory()
+        payload = {'email': BENCHMARK_EMAIL, 'password': BENCHMARK_PASSWORD}
+        user = User.objects.create_user(username=BENCHMARK_EMAIL, email=BENCHMARK_EMAIL, password=BENCHMARK_PASSWORD)
+        try:
+            for name in names:
+                if name == 'argon2' and importlib.util.find_spec('argon2') is None:
+                    self.stdout.write(f"{name:<8} skipped (argon2-cffi not installed)")
+                    continue
+                preferred = settings.PASSWORD_HASHER_CLASSES[name]
+                hashers = [preferred] + [path for path in settings.PASSWORD_HASHERS if path != preferred]
+                with override_settings(PASSWORD_HASHERS=hashers, TOKEN_BUCKET_THROTTLES={}):
+                    user.set_password(BENCHMARK_PASSWORD)
+                    user.save(update_fields=['password'])
+                    samples = []
+                    started = time.perf_counter()
+                    for _ in range(options['logins']):
+                        request_started = time.perf_counter()
+                        response = view(factory.post('/api/users/login/', payload, format='json'))
+                        samples.append((time.perf_counter() - request_started) * 1000)
+                        if response.status_code != 200:
+                            raise CommandError(f"Login failed with status {response.status_code}")
+                    elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"{name:<8} p50 {statistics.median(samples):8.1f} ms  "
+                    f"p99 {percentile(samples, 0.99):8.1f} ms  "
+                    f"{options['logins'] / elapsed:8.1f} logins/s"
+                )
+        finally:
+            user.delete()
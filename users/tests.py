@@ -1,3 +1,101 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
 
-# Create your tests here.
+from events.models import NotificationOutbox
+
+User = get_user_model()
+
+
+class CachedJWTAuthenticationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='ada@example.com', email='ada@example.com', password='pass12345', first_name='Ada')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+
+    def test_repeat_requests_skip_the_user_query(self):
+        self.client.get(reverse('dashboard-stats'))
+
+        # Dashboard stats are cached too, so a warm request touches no tables.
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('dashboard-stats'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_event_create_reads_names_from_the_cached_user(self):
+        self.client.get(reverse('dashboard-stats'))
+
+        # Event insert and outbox insert inside their savepoint; no user lookups.
+        with self.assertNumQueries(4):
+            response = self.client.post(
+                reverse('event-list-create'),
+                {'title': 'Launch', 'event_date': '2030-01-01T10:00:00Z'},
+                format='json',
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIn('scheduled by Ada.', NotificationOutbox.objects.get().message)
+
+    def test_deactivation_takes_effect_immediately(self):
+        self.client.get(reverse('dashboard-stats'))
+
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get(reverse('dashboard-stats'))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_profile_returns_full_user_record(self):
+        response = self.client.get(reverse('user-profile'))
+
+        self.assertEqual(response.data['first_name'], 'Ada')
+        self.assertEqual(response.data['username'], 'ada@example.com')
+
+
+class LoginViewTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='ada@example.com', email='ada@example.com', password='pass12345')
+
+    def _login(self):
+        return self.client.post(reverse('user-login'), {'email': 'ada@example.com', 'password': 'pass12345'}, format='json')
+
+    def test_last_login_writes_are_coalesced(self):
+        self._login()
+        self.user.refresh_from_db()
+        first_login = self.user.last_login
+
+        response = self._login()
+        self.user.refresh_from_db()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNotNone(first_login)
+        self.assertEqual(self.user.last_login, first_login)
+
+    @override_settings(PASSWORD_HASHERS=['users.hashers.TunedScryptPasswordHasher', 'users.hashers.TunedPBKDF2PasswordHasher'])
+    def test_login_rehashes_with_the_preferred_hasher(self):
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$'))
+
+        self.assertEqual(self._login().status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+
+        self.assertTrue(self.user.password.startswith('scrypt$'))
+        self.assertEqual(self._login().status_code, status.HTTP_200_OK)
+
+    @override_settings(TOKEN_BUCKET_THROTTLES={'login': {'ip': '100/min', 'account': '3/min'}})
+    def test_guessing_one_account_does_not_lock_out_others(self):
+        User.objects.create_user(username='grace@example.com', email='grace@example.com', password='pass12345')
+        guesses = [
+            self.client.post(reverse('user-login'), {'email': 'ADA@example.com', 'password': 'wrong'}, format='json', REMOTE_ADDR=f'10.0.0.{index}')
+            for index in range(5)
+        ]
+
+        other = self.client.post(reverse('user-login'), {'email': 'grace@example.com', 'password': 'pass12345'}, format='json')
+
+        self.assertEqual(guesses[2].status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(guesses[-1].status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(other.status_code, status.HTTP_200_OK)
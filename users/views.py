@@ -3,12 +3,14 @@ import logging
 from django.conf import settings
 from django.contrib.auth import authenticate, get_user_model
 from django.core.mail import send_mail
-from django.utils import timezone
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from config.throttling import token_bucket_throttle
+
+from .last_login import touch_last_login
 from .serializers import (
     ForgotPasswordSerializer,
     LoginSerializer,
@@ -22,6 +24,7 @@ logger = logging.getLogger(__name__)
 
 class RegisterView(generics.CreateAPIView):
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [token_bucket_throttle('register')]
     serializer_class = RegisterSerializer
 
     def perform_create(self, serializer):
@@ -57,6 +60,7 @@ class RegisterView(generics.CreateAPIView):
 
 class LoginView(APIView):
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [token_bucket_throttle('login')]
 
     def post(self, request):
         serializer = LoginSerializer(data=request.data)
@@ -70,8 +74,7 @@ class LoginView(APIView):
             return Response({'detail': 'Invalid email or password.'}, status=status.HTTP_401_UNAUTHORIZED)
 
         refresh = RefreshToken.for_user(user)
-        user.last_login = timezone.now()
-        user.save(update_fields=['last_login'])
+        touch_last_login(user)
 
         return Response(
             {
@@ -88,7 +91,8 @@ class ProfileView(generics.RetrieveAPIView):
     serializer_class = UserSerializer
 
     def get_object(self):
-        return self.request.user
+        # request.user is a cached, mostly-deferred record; load the full profile once.
+        return User.objects.get(pk=self.request.user.pk)
 
 
 class ForgotPasswordView(APIView):